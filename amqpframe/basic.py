@@ -6,8 +6,11 @@ Implementation of AMQP Basic class.
 """
 
 import enum
+import time
 import datetime
+import linecache
 import collections
+import collections.abc
 
 from . import types
 
@@ -36,59 +39,150 @@ class DeliveryMode(enum.Enum):
 
 _omit = object()
 
+# AMQP timestamps are accurate to a second (spec 4.2.5.4), so messages
+# created within the same half-second window share a single default
+# timestamp instead of querying the clock for each one.
+_TIMESTAMP_TTL = 0.5
+_timestamp_cache = (None, None)
+
+
+def _cached_utcnow():
+    global _timestamp_cache  # pylint: disable=global-statement,invalid-name
+    slot = int(time.monotonic() / _TIMESTAMP_TTL)
+    cached_slot, now = _timestamp_cache
+    if cached_slot != slot:
+        now = datetime.datetime.utcnow()
+        _timestamp_cache = (slot, now)
+    return now
+
+
+# Defaults for properties that are set even if not given explicitly,
+# the rest default to None.
+PROPERTY_DEFAULTS = {
+    'content_type': 'application/octet-stream',
+    'content_encoding': 'utf-8',
+}
+
+
+def _compile(name, lines, namespace):
+    """Compile the generated function `name` from the source `lines`.
+
+    Like `methods._compile`, the source is registered within `linecache`
+    so tracebacks, debuggers and `inspect` can show it.
+    """
+    filename = '<amqpframe.basic generated {}>'.format(name)
+    source = '\n'.join(lines) + '\n'
+    code = compile(source, filename, 'exec')
+    linecache.cache[filename] = (len(source), None,
+                                 source.splitlines(True), filename)
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def _make_message_init(properties, defaults):
+    """Build `Message.__init__` specialized to `properties`.
+
+    The constructor is generated once at import time so that every
+    property is a plain keyword argument assigned directly, without
+    iterating over the properties declaration per message.
+    """
+    args = ['self', "body=b''", '*', 'delivery_info=None', 'body_size=None']
+    args += ['{}={!r}'.format(name, defaults.get(name))
+             for name in properties]
+    lines = [
+        'def __init__({}):'.format(', '.join(args)),
+        # Bodies are bytes most of the time, check for that exact type
+        # first and only then fall back to the subclass check.
+        # (`type` is shadowed by the argument of the same name here.)
+        '    if (body.__class__ is not bytes and',
+        '            not isinstance(body, bytes)):',
+        '        body = body.encode(content_encoding)',
+        '    if timestamp is None:',
+        '        timestamp = _cached_utcnow()',
+        # Special attribute containing information
+        # received by BasicDeliver/BasicGetOk/etc
+        '    self.delivery_info = delivery_info',
+        '    self.body = body',
+        '    self.body_size = body_size',
+        '    self.property_values = (',
+    ]
+    lines += ['        {},'.format(name) for name in properties]
+    lines.append('    )')
+
+    return _compile('__init__', lines, {'_cached_utcnow': _cached_utcnow})
+
+
+def _make_property_accessor(index):
+    """Build an attribute exposing `Message.property_values[index]`."""
+    def fget(self):
+        return self.property_values[index]
+
+    def fset(self, value):
+        values = self.property_values
+        self.property_values = values[:index] + (value,) + values[index + 1:]
+
+    return property(fget, fset)
+
+
+class _MessageProperties(collections.abc.MutableMapping):
+    """Live mapping of the properties of a message, reads and writes go
+    through its `property_values`.
+
+    Every property in `PROPERTIES` is always present, unset ones are None;
+    deleting a property unsets it.
+    """
+
+    __slots__ = ('_message',)
+
+    def __init__(self, message):
+        self._message = message
+
+    def __getitem__(self, name):
+        if name not in PROPERTIES:
+            raise KeyError(name)
+        return getattr(self._message, name)
+
+    def __setitem__(self, name, value):
+        if name not in PROPERTIES:
+            raise KeyError(name)
+        setattr(self._message, name, value)
+
+    def __delitem__(self, name):
+        self[name] = None
+
+    def __iter__(self):
+        return iter(PROPERTIES)
+
+    def __len__(self):
+        return len(PROPERTIES)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class Message:
-    """Basic message."""
+    """Basic message.
+
+    Accepts the message body (`bytes` or `str` encoded with
+    `content_encoding`) and keyword-only `delivery_info`, `body_size`
+    and one keyword argument per property in `PROPERTIES`.
+
+    Property values are stored once, in `property_values`, a tuple
+    following the `PROPERTIES` order, which can be handed over to
+    `ContentHeaderPayload` as is.  Each property is also available as
+    an attribute and `properties` is a mapping of them, changing
+    a property through it changes `property_values` as well.
+    """
+
+    __slots__ = ('delivery_info', 'body', 'body_size', 'property_values')
 
     PROPERTIES = PROPERTIES
 
-    # pylint: disable=unused-variable,too-many-locals
-    def __init__(self, body=b'', *,
-                 delivery_info: dict=None,
-                 body_size: int=None,
-                 content_type: str='application/octet-stream',
-                 content_encoding: str='utf-8',
-                 headers: dict=None,
-                 delivery_mode: DeliveryMode=None,
-                 priority: int=None,
-                 correlation_id: str=None,
-                 reply_to: str=None,
-                 expiration: str=None,
-                 message_id: str=None,
-                 timestamp: datetime.datetime=None,
-                 type: str=None,
-                 user_id: str=None,
-                 app_id: str=None):
-
-        if not isinstance(body, bytes):
-            body = body.encode(content_encoding)
-        if timestamp is None:
-            timestamp = datetime.datetime.utcnow()
+    __init__ = _make_message_init(PROPERTIES, PROPERTY_DEFAULTS)
 
-        # Special attribute containing information
-        # received by BasicDeliver/BasicGetOk/etc
-        self.delivery_info = delivery_info
-
-        self.body = body
-        self.body_size = body_size
-
-        self.properties = collections.OrderedDict((
-            ('content_type', content_type),
-            ('content_encoding', content_encoding),
-            ('headers', headers),
-            ('delivery_mode', delivery_mode),
-            ('priority', priority),
-            ('correlation_id', correlation_id),
-            ('reply_to', reply_to),
-            ('expiration', expiration),
-            ('message_id', message_id),
-            ('timestamp', timestamp),
-            ('type', type),
-            ('user_id', user_id),
-            ('app_id', app_id),
-        ))
-        self.__dict__.update(**self.properties)
-    # pylint: enable=unused-variable,too-many-locals
+    @property
+    def properties(self):
+        return _MessageProperties(self)
 
     @property
     def decoded_body(self):
@@ -96,3 +190,8 @@ class Message:
         if isinstance(body, bytes):
             body = body.decode(self.content_encoding)
         return body
+
+
+for _index, _name in enumerate(PROPERTIES):
+    setattr(Message, _name, _make_property_accessor(_index))
+del _index, _name
@@ -10,6 +10,31 @@ This file was generated 2016-08-29 from
 """
 # Some exceptions may shadow builtins.
 # pylint: disable=redefined-builtin
+import enum
+
+
+class ReplyCode(enum.IntEnum):
+    """Reply codes sent within the Close methods, `ReplyCode(code)` gives
+    the member for a code received.
+    """
+    REPLY_SUCCESS = 200
+    CONTENT_TOO_LARGE = 311
+    NO_CONSUMERS = 313
+    CONNECTION_FORCED = 320
+    INVALID_PATH = 402
+    ACCESS_REFUSED = 403
+    NOT_FOUND = 404
+    RESOURCE_LOCKED = 405
+    PRECONDITION_FAILED = 406
+    FRAME_ERROR = 501
+    SYNTAX_ERROR = 502
+    COMMAND_INVALID = 503
+    CHANNEL_ERROR = 504
+    UNEXPECTED_FRAME = 505
+    RESOURCE_ERROR = 506
+    NOT_ALLOWED = 530
+    NOT_IMPLEMENTED = 540
+    INTERNAL_ERROR = 541
 
 
 class Error(Exception):
@@ -11,9 +11,11 @@ and have a payload according to the specification, 2.3.5.
 
 import io
 import struct
+import functools
 
 from . import basic
 from . import types
+from . import errors
 from . import methods
 
 __all__ = ['Frame', 'MethodFrame',
@@ -30,10 +32,23 @@ FRAME_HEARTBEAT = 8
 FRAME_MIN_SIZE = 4096
 FRAME_END = 206
 
+# Frame header: frame type, channel id, payload size.
+_FRAME_HEADER = struct.Struct('!BHL')
+
+_FRAME_END_BYTE = bytes((FRAME_END,))
+
+# Heartbeat frames are always the same bytes.
+_HEARTBEAT_FRAME = _FRAME_HEADER.pack(FRAME_HEARTBEAT, 0, 0) + _FRAME_END_BYTE
+
+# ContentHeaderPayload prologue: class-id, weight, body size, property flags.
+_CH_HEADER = struct.Struct('!HHQH')
+
 
 class Frame:
     """Base class for all AMQP frames."""
 
+    __slots__ = ('channel_id', 'payload')
+
     frame_type = None
     """Frame type according to the spec, subclasses must provide this."""
 
@@ -54,24 +69,31 @@ class Frame:
         cases `body_chunk_size` parameter is useful.
 
         """
-        frame_type = types.UnsignedByte.from_bytestream(stream)
-        if frame_type == 65:
+        header = stream.read(_FRAME_HEADER.size)
+        if header[:1] == b'A':
             # Not a real frame type - just b'A' from b'AMQP'
-            stream.seek(stream.tell() - 1)
+            stream.seek(stream.tell() - len(header))
             return ProtocolHeaderFrame.from_bytestream(stream)
-
-        channel_id = types.UnsignedShort.from_bytestream(stream)
-        # UnsignedLong payload size + 'size' of octets makes ByteArray useful
-        payload_bytes = types.ByteArray.from_bytestream(stream)
-        end = types.UnsignedByte.from_bytestream(stream)
+        if len(header) < _FRAME_HEADER.size:
+            raise errors.FrameError('frame header is truncated')
+
+        frame_type, channel_id, size = _FRAME_HEADER.unpack(header)
+        payload_bytes = stream.read(size)
+        if len(payload_bytes) != size:
+            raise errors.FrameError('frame payload is truncated')
+        end = stream.read(1)
         # Fail fast if `end` is not what we expect
-        assert end == FRAME_END
-
-        frame_cls = FRAMES[frame_type]
-        payload_stream = io.BytesIO(payload_bytes)
-        payload = frame_cls.payload_cls.from_bytestream(
-            payload_stream, body_chunk_size=body_chunk_size
-        )
+        if end != _FRAME_END_BYTE:
+            raise errors.FrameError('bad frame end octet {!r}'.format(end))
+
+        try:
+            frame_cls, parse_payload = _FRAME_PARSERS[frame_type]
+        except (IndexError, TypeError):
+            raise errors.FrameError(
+                'unknown frame type {}'.format(frame_type)
+            ) from None
+        payload = parse_payload(types.Cursor(payload_bytes),
+                                body_chunk_size=body_chunk_size)
 
         return frame_cls(channel_id, payload)
 
@@ -80,17 +102,76 @@ class Frame:
         specification, 2.3.5."""
         buf = io.BytesIO()
         self.payload.to_bytestream(buf)
+        payload = buf.getbuffer()
+        size = len(payload)
+
+        # Lay out the whole frame in a single pre-sized buffer
+        # so it hits the stream with one write call.
+        header_size = _FRAME_HEADER.size
+        out = bytearray(header_size + size + 1)
+        _FRAME_HEADER.pack_into(out, 0, self.frame_type, self.channel_id, size)
+        out[header_size:header_size + size] = payload
+        out[-1] = FRAME_END
+        payload.release()
+        stream.write(out)
+
+    def to_iovec(self):
+        """Returns the list of buffers making up the serialized frame,
+        ready to be handed over to scatter/gather I/O such as
+        `socket.sendmsg`."""
+        # The payload is serialized once, the frame header and the frame
+        # end are separate buffers instead of being copied around it.
+        buf = io.BytesIO()
+        self.payload.to_bytestream(buf)
+        payload = buf.getbuffer()
+        header = _FRAME_HEADER.pack(self.frame_type, self.channel_id,
+                                    len(payload))
+        return [header, payload, _FRAME_END_BYTE]
+
 
-        types.UnsignedByte(self.frame_type).to_bytestream(stream)
-        types.UnsignedShort(self.channel_id).to_bytestream(stream)
-        types.UnsignedLong(buf.tell()).to_bytestream(stream)
-        stream.write(buf.getvalue())
-        types.UnsignedByte(FRAME_END).to_bytestream(stream)
+@functools.lru_cache(maxsize=1024)
+def _present_properties(class_id, property_flags):
+    """Returns `(name, reader)` pairs of the properties set in
+    `property_flags`, in the order they are laid out in the stream,
+    where `reader` is the property type's `from_bytestream`.
+
+    Publishers tend to reuse the same handful of property combinations,
+    so the plan is memoized and parsing a content header becomes a plain
+    loop over the present properties.
+    """
+    layout = PROPERTY_LAYOUT_BY_CLASS_ID[class_id]
+    # Drop the bits below the last declared property (bit 0 is the
+    # continuation flag), so that every remaining bit maps to a property.
+    property_flags &= ~(layout[-1][0] - 1)
+
+    present = []
+    # Visit only the set bits, lowest first.
+    while property_flags:
+        lowbit = property_flags & -property_flags
+        property_flags ^= lowbit
+        _, name, _, read = layout[16 - lowbit.bit_length()]
+        present.append((name, read))
+    # The lowest bit belongs to the last property, restore stream order.
+    present.reverse()
+    return tuple(present)
+
+
+@functools.lru_cache(maxsize=256)
+def _body_frame_header(channel_id, size):
+    """Returns the header of a content body frame.
+
+    Large messages are split into many body frames of the same
+    (negotiated maximum) size on the same channel, which all share
+    the header.
+    """
+    return _FRAME_HEADER.pack(FRAME_BODY, channel_id, size)
 
 
 class Payload:
     """Base class for all payload classes."""
 
+    __slots__ = ()
+
     @classmethod
     def from_bytestream(cls, stream: io.BytesIO, body_chunk_size=None):
         """Deserialize the payload from the byte stream."""
@@ -110,8 +191,14 @@ class ContentHeaderPayload(Payload):
     +----------+--------+-----------+----------------+------------- - -
         short    short    long long       short          remainder...
 
+    `properties` is either a mapping of property names to values or,
+    like `basic.Message.property_values`, a tuple of values in
+    the order the properties are declared for the class.
+
     """
 
+    __slots__ = ('class_id', 'body_size', 'properties', 'weight')
+
     def __init__(self, class_id, body_size, properties, weight=0):
         self.class_id = class_id
         self.body_size = body_size
@@ -126,48 +213,39 @@ class ContentHeaderPayload(Payload):
 
     @classmethod
     def from_bytestream(cls, stream: io.BytesIO, body_chunk_size=None):
-        class_id = types.UnsignedShort.from_bytestream(stream)
-        weight = types.UnsignedShort.from_bytestream(stream)
-        assert weight == 0
-        body_size = types.UnsignedLongLong.from_bytestream(stream)
-        property_flags = types.UnsignedShort.from_bytestream(stream)
-
-        class_properties = PROPERTIES_BY_CLASS_ID[class_id]
-        number_of_properties = 15
-
-        properties = {}
+        class_id, weight, body_size, property_flags = _CH_HEADER.unpack(
+            stream.read(_CH_HEADER.size)
+        )
+        if weight != 0:
+            raise errors.SyntaxError(
+                'content header weight must be 0, got {}'.format(weight)
+            )
 
-        for i, (name, amqptype) in enumerate(class_properties.items()):
-            pos = number_of_properties - i
-            value = None
-            if property_flags & (1 << pos):
-                value = amqptype.from_bytestream(stream)
-            properties[name] = value
+        properties = dict.fromkeys(PROPERTIES_BY_CLASS_ID[class_id])
+        for name, read in _present_properties(class_id, property_flags):
+            properties[name] = read(stream)
 
         return cls(class_id, body_size, properties, weight)
 
     def to_bytestream(self, stream: io.BytesIO):
-        class_properties = PROPERTIES_BY_CLASS_ID[self.class_id]
+        layout = PROPERTY_LAYOUT_BY_CLASS_ID[self.class_id]
+        values = self.properties
+        if not isinstance(values, tuple):
+            values = [values.get(name) for _, name, _, _ in layout]
 
-        types.UnsignedShort(self.class_id).to_bytestream(stream)
-        types.UnsignedShort(self.weight).to_bytestream(stream)
-        types.UnsignedLongLong(self.body_size).to_bytestream(stream)
-
-        properties = bytearray()
+        properties = io.BytesIO()
         property_flags = 0
-        bitshift = 15
 
-        for name, val in self.properties.items():
+        for (flag, _, amqptype, _), val in zip(layout, values):
             if val is not None:
                 if not isinstance(val, types.BaseType):
-                    amqptype = class_properties[name]
                     val = amqptype(val)
-                property_flags |= (1 << bitshift)
-                properties += val.pack()
-            bitshift -= 1
+                property_flags |= flag
+                val.to_bytestream(properties)
 
-        types.UnsignedShort(property_flags).to_bytestream(stream)
-        stream.write(properties)
+        stream.write(_CH_HEADER.pack(self.class_id, self.weight,
+                                     self.body_size, property_flags))
+        stream.write(properties.getbuffer())
 
 
 class ContentBodyPayload(Payload):
@@ -177,14 +255,22 @@ class ContentBodyPayload(Payload):
     | Opaque binary payload | | frame-end |
     +-----------------------+ +-----------+
 
+    `data` is either `bytes` or a `memoryview` of bytes, parsed payloads
+    are memoryviews over the received frame to avoid copying the body.
+
     """
 
+    __slots__ = ('data',)
+
     def __init__(self, data):
         self.data = data
 
     @classmethod
     def from_bytestream(cls, stream, body_chunk_size):
-        return cls(stream.read(body_chunk_size))
+        data = stream.read(body_chunk_size)
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        return cls(data)
 
     def to_bytestream(self, stream):
         stream.write(self.data)
@@ -200,6 +286,8 @@ class HeartbeatPayload(Payload):
 
     """
 
+    __slots__ = ('data',)
+
     def __init__(self):
         self.data = b''
 
@@ -208,7 +296,8 @@ class HeartbeatPayload(Payload):
         return cls()
 
     def to_bytestream(self, stream: io.BytesIO):
-        types.ByteArray(self.data).to_bytestream(stream)
+        # Heartbeat frames carry no payload at all.
+        pass
 
 
 class ProtocolHeaderPayload(Payload):
@@ -221,6 +310,8 @@ class ProtocolHeaderPayload(Payload):
 
     """
 
+    __slots__ = ('protocol_major', 'protocol_minor', 'protocol_revision')
+
     PREFIX = b'AMQP\x00'
 
     def __init__(self,
@@ -256,9 +347,26 @@ class MethodFrame(Frame):
 
     """
 
+    __slots__ = ()
+
     frame_type = FRAME_METHOD
     payload_cls = methods.Method
 
+    def to_bytestream(self, stream: io.BytesIO):
+        for buf in self.to_iovec():
+            stream.write(buf)
+
+    def to_iovec(self):
+        # The method is encoded right after the room left for the frame
+        # header, the whole frame is laid out in one buffer this way.
+        header_size = _FRAME_HEADER.size
+        buf = bytearray(header_size)
+        self.payload.encode_into(buf)
+        _FRAME_HEADER.pack_into(buf, 0, FRAME_METHOD, self.channel_id,
+                                len(buf) - header_size)
+        buf.append(FRAME_END)
+        return [buf]
+
 
 class ContentHeaderFrame(Frame):
     """Content is the application data we carry from client-to-client via the
@@ -272,6 +380,8 @@ class ContentHeaderFrame(Frame):
 
     """
 
+    __slots__ = ()
+
     frame_type = FRAME_HEADER
     payload_cls = ContentHeaderPayload
 
@@ -286,9 +396,23 @@ class ContentBodyFrame(Frame):
 
     """
 
+    __slots__ = ()
+
     frame_type = FRAME_BODY
     payload_cls = ContentBodyPayload
 
+    def to_bytestream(self, stream: io.BytesIO):
+        for buf in self.to_iovec():
+            stream.write(buf)
+
+    def to_iovec(self):
+        # Bodies can be large, so the data is passed on as is between
+        # the (cached) frame header and the frame end.
+        data = self.payload.data
+        return [_body_frame_header(self.channel_id, len(data)),
+                data,
+                _FRAME_END_BYTE]
+
 
 class HeartbeatFrame(Frame):
     """Heartbeat frames tell the recipient that the sender is still alive. The
@@ -298,6 +422,8 @@ class HeartbeatFrame(Frame):
 
     """
 
+    __slots__ = ()
+
     frame_type = FRAME_HEARTBEAT
     payload_cls = HeartbeatPayload
     expected_channel_id = 0
@@ -306,6 +432,12 @@ class HeartbeatFrame(Frame):
         assert channel_id == self.expected_channel_id
         super().__init__(channel_id, payload)
 
+    def to_bytestream(self, stream: io.BytesIO):
+        stream.write(_HEARTBEAT_FRAME)
+
+    def to_iovec(self):
+        return [_HEARTBEAT_FRAME]
+
 
 class ProtocolHeaderFrame(Frame):
     """This is actually not a frame according to the protocol - just bytes,
@@ -315,6 +447,8 @@ class ProtocolHeaderFrame(Frame):
     Specification 4.2.2.
     """
 
+    __slots__ = ()
+
     payload_cls = ProtocolHeaderPayload
 
     @classmethod
@@ -325,11 +459,40 @@ class ProtocolHeaderFrame(Frame):
     def to_bytestream(self, stream: io.BytesIO):
         self.payload.to_bytestream(stream)
 
+    def to_iovec(self):
+        # There is neither a frame header nor a frame end.
+        buf = io.BytesIO()
+        self.payload.to_bytestream(buf)
+        return [buf.getbuffer()]
+
 
+# Frame type -> frame class, frame types are small integers so
+# the table is a tuple indexed by the frame type itself.
 # pylint: disable=no-member
-FRAMES = {cls.frame_type: cls for cls in Frame.__subclasses__()}
+FRAMES = tuple(
+    next((cls for cls in Frame.__subclasses__()
+          if cls.frame_type == frame_type), None)
+    for frame_type in range(FRAME_HEARTBEAT + 1)
+)
+
+# Frame type -> (frame class, payload parser), so that dispatching
+# an inbound frame is a single lookup.
+_FRAME_PARSERS = tuple(
+    (cls, cls.payload_cls.from_bytestream) if cls is not None else None
+    for cls in FRAMES
+)
 
 # Just in case somebody will want to add non-basic stuff...
 PROPERTIES_BY_CLASS_ID = {
     60: basic.PROPERTIES,
 }
+
+# Class id -> ((property flag bit, name, type, type.from_bytestream), ...)
+# in declaration order, the first property owning the most significant bit,
+# spec 4.2.6.1.  Everything the content header codec needs per property
+# is resolved once here.
+PROPERTY_LAYOUT_BY_CLASS_ID = {
+    class_id: tuple((1 << (15 - i), name, amqptype, amqptype.from_bytestream)
+                    for i, (name, amqptype) in enumerate(properties.items()))
+    for class_id, properties in PROPERTIES_BY_CLASS_ID.items()
+}
@@ -15,25 +15,416 @@ This file was generated 2016-08-29 from
 
 import io
 import collections
+import struct
+import linecache
+import functools
+import itertools
 
 from . import types
+from . import errors
+
+# Class id and method id, the prefix of every method frame payload.
+_METHOD_TYPE = struct.Struct('!HH')
+
+# Several methods share the same fields (e.g. ConnectionTune and
+# ConnectionTuneOK, ExchangeBind and ExchangeUnbind, all the methods
+# without fields), such classes share a single `field_info` tuple and,
+# through the caches of the `_make_*` functions below, the generated code.
+_FIELD_INFOS = {}
+
+_generated_count = itertools.count()
+
+# Octet -> its eight bits (least significant first) as the `Bool`s
+# shared with `types`, so decoding a group of bits is a table lookup.
+_BITS = types._OCTET_BITS  # pylint: disable=protected-access
+
+# Exchange names, routing keys and consumer tags received come from
+# a handful of values in practice, so instead of validating and allocating
+# them for every method, decoded values of these fields are shared.
+_INTERNED_FIELDS = frozenset(('exchange', 'routing_key', 'consumer_tag'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _interned_shortstr(raw):
+    return types.ShortStr(raw)
+
+
+# Likewise, the values sent are packed once, length prefix included.
+@functools.lru_cache(maxsize=1024)
+def _packed_shortstr(value):
+    return value.pack()
+
+
+# Methods received or sent for every message keep up to `_POOL_SIZE`
+# released instances for the decoders to reuse, see `Method.release`.
+_POOLED = frozenset(('BasicDeliver', 'BasicAck', 'BasicPublish'))
+_POOL_SIZE = 1024
+
+
+# Method type -> class dispatch table, filled in as classes are created
+METHODS = {}
+
+# The same dispatch table, flattened and indexed by
+# `(class_id << 8) | method_id` to avoid hashing a tuple per method;
+# slots of unknown methods are None.
+METHODS_TABLE = []
+
+# Indexed the same way, 1 for synchronous methods and 0 otherwise,
+# so that protocol state checks don't need to look up the class.
+SYNCHRONOUS_FLAGS = bytearray()
+
+# `(class_id << 8) | method_id` -> decoder of the methods carrying
+# at most a single bit or number, see `Method.light_from_buffer`.
+_LIGHT_DECODERS = {}
+
+
+def _register(method_cls):
+    key = method_cls.method_key
+    if key >= len(METHODS_TABLE):
+        METHODS_TABLE.extend([None] * (key + 1 - len(METHODS_TABLE)))
+        SYNCHRONOUS_FLAGS.extend(bytes(key + 1 - len(SYNCHRONOUS_FLAGS)))
+    METHODS_TABLE[key] = METHODS[method_cls.method_type] = method_cls
+    SYNCHRONOUS_FLAGS[key] = method_cls.synchronous
+
+
+def _method_cls(class_id, method_id):
+    if method_id <= 0xFF:
+        try:
+            method_cls = METHODS_TABLE[(class_id << 8) | method_id]
+        except IndexError:
+            pass
+        else:
+            if method_cls is not None:
+                return method_cls
+    raise errors.CommandInvalid(
+        'unknown method {}'.format((class_id, method_id))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_method_init(field_info):
+    """Build `__init__` of a `Method` subclass specialized to `field_info`.
+
+    Every field becomes a keyword-only argument and an attribute
+    (`global` is spelled `global_`), reserved fields are optional and
+    always get the empty value of their type.  The types are bound as
+    globals of the generated code.
+    """
+    args = []
+    lines = []
+    namespace = {}
+    for i, (name, amqptype) in enumerate(field_info):
+        arg = _arg_name(name)
+        amqptype_name = '_t{}'.format(i)
+        namespace[amqptype_name] = amqptype
+        if name.startswith('reserved'):
+            args.append(arg + '=None')
+            value = '{}()'.format(amqptype_name)
+        else:
+            args.append(arg)
+            value = '{0}() if {1} is None else {0}({1})'.format(
+                amqptype_name, arg
+            )
+        lines.append('    self.{} = {}'.format(arg, value))
+
+    lines.insert(0, 'def __init__({}):'.format(
+        ', '.join(['self', '*'] + args) if args else 'self'
+    ))
+    if not args:
+        lines.append('    pass')
+    return _compile('__init__', lines, namespace)
+
+
+def _allocation(pooled):
+    if pooled:
+        return ['    pool = cls._pool',
+                '    self = pool.pop() if pool else _new(cls)']
+    return ['    self = _new(cls)']
+
+
+@functools.lru_cache(maxsize=None)
+def _make_fields_decoder(layout, pooled=False):
+    """Build `fields_from_bytestream` specialized to `layout`.
+
+    The fields are read by straight-line code, a group of bits is read
+    as one octet and looked up in `_BITS`, a group of fixed-width
+    fields is read by a single `struct` call, `_INTERNED_FIELDS` are
+    shared through `_interned_shortstr`.  Values read are of the
+    right type already, so they are assigned to a bare instance without
+    going through `__init__`.  If `pooled`, the instance is taken from
+    the class' pool of released ones when it's not empty.
+    """
+    namespace = {'_new': object.__new__, '_BITS': _BITS,
+                 '_interned_shortstr': _interned_shortstr}
+    if not layout:
+        return classmethod(lambda cls, stream: cls._instance)
+
+    lines = ['def fields_from_bytestream(cls, stream):']
+    lines += _allocation(pooled)
+    for i, (amqptype, names) in enumerate(layout):
+        if isinstance(amqptype, struct.Struct):
+            struct_name = '_s{}'.format(i)
+            namespace[struct_name] = amqptype
+            lines.append('    {}, = {}.unpack(stream.read({}))'.format(
+                ', '.join('self.' + _arg_name(name) for name in names),
+                struct_name, amqptype.size
+            ))
+        elif amqptype is types.Bool:
+            lines.append('    bits = _BITS[stream.read(1)[0]]')
+            lines += ['    self.{} = bits[{}]'.format(_arg_name(name), bit)
+                      for bit, name in enumerate(names)]
+        elif amqptype is types.ShortStr and names[0] in _INTERNED_FIELDS:
+            lines.append('    self.{} = _interned_shortstr('
+                         'bytes(stream.read(stream.read(1)[0])))'.format(
+                             _arg_name(names[0])
+                         ))
+        else:
+            amqptype_name = '_t{}'.format(i)
+            namespace[amqptype_name] = amqptype
+            lines.append('    self.{} = {}.from_bytestream(stream)'.format(
+                _arg_name(names[0]), amqptype_name
+            ))
+    lines.append('    return self')
+    return classmethod(_compile('fields_from_bytestream', lines, namespace))
+
+
+@functools.lru_cache(maxsize=None)
+def _make_buffer_decoder(layout, pooled=False):
+    """Build `fields_from_buffer` specialized to `layout`.
+
+    Same as `_make_fields_decoder`, but fixed-width fields and bits are
+    read in place with `unpack_from` and indexing, no intermediate `bytes`
+    are sliced out of the buffer.  Other fields are read by their types
+    through a `types.Cursor` over the same buffer.
+    """
+    if not layout:
+        return classmethod(lambda cls, view, offset: (cls._instance, offset))
+
+    namespace = {'_new': object.__new__, '_BITS': _BITS,
+                 '_Cursor': types.Cursor,
+                 '_interned_shortstr': _interned_shortstr}
+    lines = ['def fields_from_buffer(cls, view, offset):']
+    lines += _allocation(pooled)
+    cursor = False
+    for i, (amqptype, names) in enumerate(layout):
+        attr = _arg_name(names[0])
+        if (cursor and (isinstance(amqptype, struct.Struct) or
+                        amqptype is types.Bool or
+                        names[0] in _INTERNED_FIELDS)):
+            lines.append('    offset = cursor.tell()')
+            cursor = False
+
+        if isinstance(amqptype, struct.Struct):
+            struct_name = '_s{}'.format(i)
+            namespace[struct_name] = amqptype
+            lines.append('    {}, = {}.unpack_from(view, offset)'.format(
+                ', '.join('self.' + _arg_name(name) for name in names),
+                struct_name
+            ))
+            lines.append('    offset += {}'.format(amqptype.size))
+        elif amqptype is types.Bool:
+            lines.append('    bits = _BITS[view[offset]]')
+            lines += ['    self.{} = bits[{}]'.format(_arg_name(name), bit)
+                      for bit, name in enumerate(names)]
+            lines.append('    offset += 1')
+        elif amqptype is types.ShortStr and names[0] in _INTERNED_FIELDS:
+            lines += ['    size = view[offset]',
+                      '    offset += 1 + size',
+                      '    self.{} = _interned_shortstr('
+                      'bytes(view[offset - size:offset]))'.format(attr)]
+        else:
+            amqptype_name = '_t{}'.format(i)
+            namespace[amqptype_name] = amqptype
+            if not cursor:
+                lines.append('    cursor = _Cursor(view, offset)')
+                cursor = True
+            lines.append('    self.{} = {}.from_bytestream(cursor)'.format(
+                attr, amqptype_name
+            ))
+
+    if cursor:
+        lines.append('    offset = cursor.tell()')
+    lines.append('    return self, offset')
+    return classmethod(_compile('fields_from_buffer', lines, namespace))
+
+
+@functools.lru_cache(maxsize=None)
+def _make_encoder(layout):
+    """Build `encode_into` specialized to `layout`.
+
+    The fields are packed by straight-line code into the given buffer,
+    a group of bits is packed into one octet by a single expression,
+    a group of fixed-width fields is packed by a single `struct` call,
+    `_INTERNED_FIELDS` are packed through `_packed_shortstr`.
+    """
+    namespace = {'_packed_shortstr': _packed_shortstr}
+    lines = ['def encode_into(self, buf):',
+             '    buf += self._method_type_bytes']
+    for i, (amqptype, names) in enumerate(layout):
+        if isinstance(amqptype, struct.Struct):
+            struct_name = '_s{}'.format(i)
+            namespace[struct_name] = amqptype
+            lines.append('    buf += {}.pack({})'.format(
+                struct_name,
+                ', '.join('self.' + _arg_name(name) for name in names)
+            ))
+        elif amqptype is types.Bool:
+            lines.append('    buf.append({})'.format(' | '.join(
+                '({} if self.{} else 0)'.format(1 << bit, _arg_name(name))
+                for bit, name in enumerate(names)
+            )))
+        elif amqptype is types.ShortStr and names[0] in _INTERNED_FIELDS:
+            lines.append('    buf += _packed_shortstr(self.{})'.format(
+                _arg_name(names[0])
+            ))
+        else:
+            lines.append('    self.{}.pack_into(buf)'.format(
+                _arg_name(names[0])
+            ))
+    return _compile('encode_into', lines, namespace)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_layout(field_info):
+    """Collapse `field_info` into a tuple of `(amqptype, names)` groups.
+
+    Bits are accumulated into whole octets (spec 4.2.5.2), so up to eight
+    consecutive bits make a single group.  Consecutive fixed-width fields
+    (numbers) make a single group too, its `amqptype` being a
+    `struct.Struct` covering all of them.  Every other field makes a group
+    of its own.
+    """
+    groups = []
+    for name, amqptype in field_info:
+        last = groups[-1] if groups else (None, ())
+        if (amqptype is types.Bool and last[0] is types.Bool and
+                len(last[1]) < 8):
+            last[1].append(name)
+        elif (amqptype._STRUCT_FMT is not None and
+              isinstance(last[0], str)):
+            groups[-1] = (last[0] + amqptype._STRUCT_FMT, last[1] + [name])
+        elif amqptype._STRUCT_FMT is not None:
+            groups.append(('!' + amqptype._STRUCT_FMT, [name]))
+        else:
+            groups.append((amqptype, [name]))
+
+    return tuple((struct.Struct(amqptype) if isinstance(amqptype, str)
+                  else amqptype, tuple(names))
+                 for amqptype, names in groups)
+
+
+def _light_empty(view, offset):
+    return None, offset
+
+
+def _light_bit(view, offset):
+    return view[offset] & 1 == 1, offset + 1
+
+
+def _make_light_decoder(layout):
+    """Build a decoder returning the plain value of the only field
+    in `layout` and the offset right after it.
+
+    Returns None unless that field is a bit or a fixed-width number.
+    """
+    if len(layout) != 1 or len(layout[0][1]) != 1:
+        return None
+    amqptype = layout[0][0]
+    if amqptype is types.Bool:
+        return _light_bit
+    if not isinstance(amqptype, struct.Struct):
+        return None
+
+    unpack_from, size = amqptype.unpack_from, amqptype.size
+
+    def light_decoder(view, offset):
+        value, = unpack_from(view, offset)
+        return value, offset + size
+    return light_decoder
+
+
+def _arg_name(name):
+    return name if name != 'global' else 'global_'
+
+
+def _compile(name, lines, namespace):
+    """Compile the generated function `name` from the source `lines`.
+
+    The source is registered within `linecache` under a unique file name,
+    so tracebacks, debuggers and profilers can show generated code
+    as well as the hand-written one.
+    """
+    filename = '<amqpframe.methods generated {} #{}>'.format(
+        name, next(_generated_count)
+    )
+    source = '\n'.join(lines) + '\n'
+    code = compile(source, filename, 'exec')
+    linecache.cache[filename] = (len(source), None,
+                                 source.splitlines(True), filename)
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace[name]
 
 
 class Method:
-    """Base class for all AMQP methods."""
+    """Base class for all AMQP methods.
+
+    `__init__`, `fields_from_bytestream`, `fields_from_buffer` and
+    `encode_into` of every subclass are generated from its `field_info`
+    when the class is created.
+    Field values are stored in slots named after the fields, `values`
+    returns them as a dict.  `field_names` are the names of the fields
+    in `field_info` order.  `method_key` is `method_type`
+    as a single integer, `(class_id << 8) | method_id`, the key
+    of `METHODS_TABLE`.
+
+    Decoded methods hold numeric fields (octets, shorts, longs and long
+    longs) as plain `int`s, as read by the `struct` groups, while
+    constructed ones hold instances of the field types.  Bits, strings
+    and tables are instances of their types either way.  Both compare
+    equal, but don't rely on `isinstance` checks or `to_bytestream`
+    of decoded numeric fields.
+    """
 
-    content = False
+    __slots__ = ()
 
-    def __init__(self, *values):
-        assert len(values) == len(self.field_info)
+    content = False
 
-        self.values = collections.OrderedDict()
-        for (name, amqptype), value in zip(self.field_info, values):
-            if value is None:
-                value = amqptype()
-            else:
-                value = amqptype(value)
-            self.values[name] = value
+    _pool = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'method_type' not in cls.__dict__:
+            # Intermediate base classes are neither generated nor registered.
+            return
+        class_id, method_id = cls.method_type
+        cls.method_key = (class_id << 8) | method_id
+        cls._method_type_bytes = _METHOD_TYPE.pack(class_id, method_id)
+        if cls.field_info:
+            field_info = _FIELD_INFOS.setdefault(cls.field_info,
+                                                 cls.field_info)
+            cls.field_info = field_info
+            cls.field_names = tuple(name for name, _ in field_info)
+            cls.__init__ = _make_method_init(field_info)
+            cls._layout = _make_layout(field_info)
+            pooled = cls.__name__ in _POOLED
+            if pooled:
+                cls._pool = collections.deque(maxlen=_POOL_SIZE)
+            cls.fields_from_bytestream = _make_fields_decoder(cls._layout,
+                                                              pooled)
+            cls.fields_from_buffer = _make_buffer_decoder(cls._layout, pooled)
+            cls.encode_into = _make_encoder(cls._layout)
+            light_decoder = _make_light_decoder(cls._layout)
+        else:
+            cls._instance = object.__new__(cls)
+            light_decoder = _light_empty
+        if light_decoder is not None:
+            _LIGHT_DECODERS[cls.method_key] = light_decoder
+        _register(cls)
+
+    @property
+    def values(self):
+        return {name: getattr(self, attr)
+                for name, attr in zip(self.field_names, self.__slots__)}
 
     @classmethod
     def from_bytestream(cls, stream: io.BytesIO, body_chunk_size=None):
@@ -43,70 +434,125 @@ class Method:
         according to the specification, 2.3.5.1.
         """
 
-        class_id = types.UnsignedShort.from_bytestream(stream)
-        method_id = types.UnsignedShort.from_bytestream(stream)
-        method_cls = METHODS[(class_id, method_id)]
-
-        kwargs = {}
-        bit_names = []
-        number_of_bits = 0
-        for name, amqptype in method_cls.field_info:
-            if name == 'global':
-                name = 'global_'
-
-            if amqptype is types.Bool:
-                number_of_bits += 1
-                bit_names.append(name)
-                continue
-            elif number_of_bits:
-                # We have some bools but this next field is not a bool
-                bits = types.Bool.many_from_bytestream(stream, number_of_bits)
-                for bit_name, bit in zip(bit_names, bits):
-                    kwargs[bit_name] = bit
-                number_of_bits = 0
-                bit_names.clear()
-
-            kwargs[name] = amqptype.from_bytestream(stream)
-
-        if number_of_bits:
-            bits = types.Bool.many_from_bytestream(stream, number_of_bits)
-            for name, bit in zip(bit_names, bits):
-                kwargs[name] = bit
-            number_of_bits = 0
-            bit_names.clear()
-        return method_cls(**kwargs)
+        method_cls = _method_cls(*_METHOD_TYPE.unpack(stream.read(4)))
+        return method_cls.fields_from_bytestream(stream)
+
+    @classmethod
+    def from_buffer(cls, buffer, offset=0):
+        """Instantiates a `Method` subclass from `buffer` (any object
+        supporting the buffer protocol) starting at `offset`.
+
+        Returns the method and the offset right after it, so that
+        consecutive methods can be read from one buffer without copying.
+        """
+        view = memoryview(buffer)
+        method_cls = _method_cls(*_METHOD_TYPE.unpack_from(view, offset))
+        return method_cls.fields_from_buffer(view, offset + _METHOD_TYPE.size)
+
+    @classmethod
+    def light_from_buffer(cls, buffer, offset=0):
+        """Like `from_buffer`, but doesn't instantiate the methods carrying
+        at most a single bit or number (ChannelFlow, BasicRecover,
+        ConfirmSelect, QueuePurgeOK, the methods without fields, ...).
+
+        Returns `(method_key, payload, offset)`, `payload` being the plain
+        value of the only field of such methods (None if there are no
+        fields) and the method instance for every other method.
+        """
+        view = memoryview(buffer)
+        class_id, method_id = _METHOD_TYPE.unpack_from(view, offset)
+        offset += _METHOD_TYPE.size
+        if method_id <= 0xFF:
+            method_key = (class_id << 8) | method_id
+            light_decoder = _LIGHT_DECODERS.get(method_key)
+            if light_decoder is not None:
+                payload, offset = light_decoder(view, offset)
+                return method_key, payload, offset
+        method_cls = _method_cls(class_id, method_id)
+        method, offset = method_cls.fields_from_buffer(view, offset)
+        return method_cls.method_key, method, offset
+
+    @classmethod
+    def many_from_buffer(cls, buffer, offsets):
+        """Instantiates a `Method` subclass from `buffer` at each offset
+        in `offsets`, returns the list of methods.
+
+        Meant for several methods received at once, the buffer is wrapped
+        into a memoryview once for all of them.
+        """
+        view = memoryview(buffer)
+        unpack_method_type = _METHOD_TYPE.unpack_from
+        header_size = _METHOD_TYPE.size
+        methods = []
+        for offset in offsets:
+            method_cls = _method_cls(*unpack_method_type(view, offset))
+            method, _ = method_cls.fields_from_buffer(view,
+                                                      offset + header_size)
+            methods.append(method)
+        return methods
+
+    def release(self):
+        """Hand the method back to its class for the decoders to reuse.
+
+        Only instances of `_POOLED` classes are kept, releasing any other
+        method does nothing.  The method's fields are cleared and it must
+        not be used afterwards, releasing it again raises `RuntimeError`.
+        Pools aren't thread-safe: release methods from the thread decoding
+        them, e.g. the one serving the channel they were received on.
+        """
+        pool = self._pool
+        if pool is not None:
+            # Fields are never None otherwise, a cleared field tells that
+            # the method is in the pool already: pooling it twice would
+            # hand it out to two decoded methods.
+            if getattr(self, self.__slots__[0]) is None:
+                raise RuntimeError('{} is released already'.format(
+                    self.__class__.__name__
+                ))
+            for attr in self.__slots__:
+                setattr(self, attr, None)
+            pool.append(self)
+
+    @classmethod
+    def fields_from_bytestream(cls, stream: io.BytesIO):
+        """Instantiates the class from the method fields in the byte stream,
+        the class id and method id being read already.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def fields_from_buffer(cls, view: memoryview, offset: int):
+        """Instantiates the class from the method fields in `view` starting
+        at `offset`, returns the method and the offset right after it.
+        """
+        raise NotImplementedError
+
+    def encode_into(self, buf: bytearray):
+        """Serialize the method according to the specification, 2.3.5.1,
+        appending it to `buf`.
+
+        Lets the caller lay out several methods, or a whole frame,
+        in a single buffer without intermediate `bytes` objects.
+        """
+        raise NotImplementedError
+
+    def to_bytes(self):
+        """Serialize the method according to the specification, 2.3.5.1."""
+        buf = bytearray()
+        self.encode_into(buf)
+        return bytes(buf)
 
     def to_bytestream(self, stream: io.BytesIO):
         """Serialize the method into the byte stream according to
         the specification, 2.3.5.1.
         """
-
-        types.UnsignedShort(self.method_type[0]).to_bytestream(stream)
-        types.UnsignedShort(self.method_type[1]).to_bytestream(stream)
-        bits = []
-        for value in self.values.values():
-            if isinstance(value, types.Bool):
-                bits.append(value)
-            else:
-                if bits:
-                    types.Bool.many_to_bytestream(bits, stream)
-                    bits = []
-                value.to_bytestream(stream)
-
-        if bits:
-            types.Bool.many_to_bytestream(bits, stream)
-
-    def __getattr__(self, name):
-        try:
-            return self.values[name]
-        except KeyError:
-            raise AttributeError('{} object has no attribute {}'.format(
-                type(self).__name__, name
-            )) from None
+        stream.write(self.to_bytes())
 
     def __eq__(self, other):
-        return (self.method_type == other.method_type and
-                self.values == other.values)
+        if self.method_key != other.method_key:
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.__slots__)
 
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__,
@@ -114,6 +560,41 @@ class Method:
                                           for k, v in self.values.items()))
 
 
+class _EmptyMethod(Method):
+    """Base class for methods without fields.
+
+    These carry no state and can't be changed: constructing and decoding
+    them give a shared per-class instance and encoding gives the method
+    header only, so no code is generated for them.
+    """
+
+    __slots__ = ()
+
+    field_info = ()
+    field_names = ()
+    _layout = ()
+
+    def __new__(cls):
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def fields_from_bytestream(cls, stream: io.BytesIO):
+        return cls._instance
+
+    @classmethod
+    def fields_from_buffer(cls, view, offset):
+        return cls._instance, offset
+
+    def encode_into(self, buf):
+        buf += self._method_type_bytes
+
+    def to_bytes(self):
+        return self._method_type_bytes
+
+
 class ConnectionStart(Method):
     """This method starts the connection negotiation process by telling the
     client the protocol version that the server proposes, along with a list of
@@ -136,21 +617,15 @@ class ConnectionStart(Method):
         ("locales", types.Longstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'version_major',
+        'version_minor',
+        'server_properties',
+        'mechanisms',
+        'locales',
+    )
 
-    def __init__(self, *,
-                 version_major,
-                 version_minor,
-                 server_properties,
-                 mechanisms,
-                 locales):
-        super().__init__(
-            version_major,
-            version_minor,
-            server_properties,
-            mechanisms,
-            locales,
-        )
+    synchronous = True
 
 
 class ConnectionStartOK(Method):
@@ -171,19 +646,14 @@ class ConnectionStartOK(Method):
         ("locale", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'client_properties',
+        'mechanism',
+        'response',
+        'locale',
+    )
 
-    def __init__(self, *,
-                 client_properties,
-                 mechanism,
-                 response,
-                 locale):
-        super().__init__(
-            client_properties,
-            mechanism,
-            response,
-            locale,
-        )
+    synchronous = True
 
 
 class ConnectionSecure(Method):
@@ -200,13 +670,11 @@ class ConnectionSecure(Method):
         ("challenge", types.Longstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'challenge',
+    )
 
-    def __init__(self, *,
-                 challenge):
-        super().__init__(
-            challenge,
-        )
+    synchronous = True
 
 
 class ConnectionSecureOK(Method):
@@ -222,13 +690,11 @@ class ConnectionSecureOK(Method):
         ("response", types.Longstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'response',
+    )
 
-    def __init__(self, *,
-                 response):
-        super().__init__(
-            response,
-        )
+    synchronous = True
 
 
 class ConnectionTune(Method):
@@ -248,17 +714,13 @@ class ConnectionTune(Method):
         ("heartbeat", types.Short),
     )
 
-    synchronous = True
+    __slots__ = (
+        'channel_max',
+        'frame_max',
+        'heartbeat',
+    )
 
-    def __init__(self, *,
-                 channel_max,
-                 frame_max,
-                 heartbeat):
-        super().__init__(
-            channel_max,
-            frame_max,
-            heartbeat,
-        )
+    synchronous = True
 
 
 class ConnectionTuneOK(Method):
@@ -279,17 +741,13 @@ class ConnectionTuneOK(Method):
         ("heartbeat", types.Short),
     )
 
-    synchronous = True
+    __slots__ = (
+        'channel_max',
+        'frame_max',
+        'heartbeat',
+    )
 
-    def __init__(self, *,
-                 channel_max,
-                 frame_max,
-                 heartbeat):
-        super().__init__(
-            channel_max,
-            frame_max,
-            heartbeat,
-        )
+    synchronous = True
 
 
 class ConnectionOpen(Method):
@@ -312,17 +770,13 @@ class ConnectionOpen(Method):
         ("reserved_2", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'virtual_host',
+        'reserved_1',
+        'reserved_2',
+    )
 
-    def __init__(self, *,
-                 virtual_host,
-                 reserved_1=None,
-                 reserved_2=None):
-        super().__init__(
-            virtual_host,
-            types.Shortstr(),
-            types.Bit(),
-        )
+    synchronous = True
 
 
 class ConnectionOpenOK(Method):
@@ -337,13 +791,11 @@ class ConnectionOpenOK(Method):
         ("reserved_1", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None):
-        super().__init__(
-            types.Shortstr(),
-        )
+    synchronous = True
 
 
 class ConnectionClose(Method):
@@ -368,29 +820,24 @@ class ConnectionClose(Method):
         ("method_id", types.Short),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reply_code',
+        'reply_text',
+        'class_id',
+        'method_id',
+    )
 
-    def __init__(self, *,
-                 reply_code,
-                 reply_text,
-                 class_id,
-                 method_id):
-        super().__init__(
-            reply_code,
-            reply_text,
-            class_id,
-            method_id,
-        )
+    synchronous = True
 
 
-class ConnectionCloseOK(Method):
+class ConnectionCloseOK(_EmptyMethod):
     """This method confirms a Connection.Close method and tells the recipient
     that it is safe to release resources for the connection and close the
     socket.
     """
     method_type = (10, 51)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -407,13 +854,11 @@ class ChannelOpen(Method):
         ("reserved_1", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None):
-        super().__init__(
-            types.Shortstr(),
-        )
+    synchronous = True
 
 
 class ChannelOpenOK(Method):
@@ -428,13 +873,11 @@ class ChannelOpenOK(Method):
         ("reserved_1", types.Longstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None):
-        super().__init__(
-            types.Longstr(),
-        )
+    synchronous = True
 
 
 class ChannelFlow(Method):
@@ -454,13 +897,11 @@ class ChannelFlow(Method):
         ("active", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'active',
+    )
 
-    def __init__(self, *,
-                 active):
-        super().__init__(
-            active,
-        )
+    synchronous = True
 
 
 class ChannelFlowOK(Method):
@@ -475,13 +916,11 @@ class ChannelFlowOK(Method):
         ("active", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'active',
+    )
 
-    def __init__(self, *,
-                 active):
-        super().__init__(
-            active,
-        )
+    synchronous = False
 
 
 class ChannelClose(Method):
@@ -506,28 +945,23 @@ class ChannelClose(Method):
         ("method_id", types.Short),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reply_code',
+        'reply_text',
+        'class_id',
+        'method_id',
+    )
 
-    def __init__(self, *,
-                 reply_code,
-                 reply_text,
-                 class_id,
-                 method_id):
-        super().__init__(
-            reply_code,
-            reply_text,
-            class_id,
-            method_id,
-        )
+    synchronous = True
 
 
-class ChannelCloseOK(Method):
+class ChannelCloseOK(_EmptyMethod):
     """This method confirms a Channel.Close method and tells the recipient
     that it is safe to release resources for the channel.
     """
     method_type = (20, 41)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -561,38 +995,28 @@ class ExchangeDeclare(Method):
         ("arguments", types.Table),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'exchange',
+        'type',
+        'passive',
+        'durable',
+        'auto_delete',
+        'internal',
+        'no_wait',
+        'arguments',
+    )
+
     synchronous = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 exchange,
-                 type,
-                 passive,
-                 durable,
-                 auto_delete,
-                 internal,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            exchange,
-            type,
-            passive,
-            durable,
-            auto_delete,
-            internal,
-            no_wait,
-            arguments,
-        )
-
-
-class ExchangeDeclareOK(Method):
+
+class ExchangeDeclareOK(_EmptyMethod):
     """This method confirms a Declare method and confirms the name of the
     exchange, essential for automatically-named exchanges.
     """
     method_type = (40, 11)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -616,27 +1040,22 @@ class ExchangeDelete(Method):
         ("no_wait", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'exchange',
+        'if_unused',
+        'no_wait',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 exchange,
-                 if_unused,
-                 no_wait):
-        super().__init__(
-            types.Short(),
-            exchange,
-            if_unused,
-            no_wait,
-        )
+    synchronous = True
 
 
-class ExchangeDeleteOK(Method):
+class ExchangeDeleteOK(_EmptyMethod):
     """This method confirms the deletion of an exchange.
     """
     method_type = (40, 21)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -663,31 +1082,24 @@ class ExchangeBind(Method):
         ("arguments", types.Table),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'destination',
+        'source',
+        'routing_key',
+        'no_wait',
+        'arguments',
+    )
+
     synchronous = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 destination,
-                 source,
-                 routing_key,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            destination,
-            source,
-            routing_key,
-            no_wait,
-            arguments,
-        )
-
-
-class ExchangeBindOK(Method):
+
+class ExchangeBindOK(_EmptyMethod):
     """This method confirms that the bind was successful.
     """
     method_type = (40, 31)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -714,31 +1126,24 @@ class ExchangeUnbind(Method):
         ("arguments", types.Table),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'destination',
+        'source',
+        'routing_key',
+        'no_wait',
+        'arguments',
+    )
+
     synchronous = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 destination,
-                 source,
-                 routing_key,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            destination,
-            source,
-            routing_key,
-            no_wait,
-            arguments,
-        )
-
-
-class ExchangeUnbindOK(Method):
+
+class ExchangeUnbindOK(_EmptyMethod):
     """This method confirms that the unbind was successful.
     """
     method_type = (40, 51)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -771,27 +1176,18 @@ class QueueDeclare(Method):
         ("arguments", types.Table),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'passive',
+        'durable',
+        'exclusive',
+        'auto_delete',
+        'no_wait',
+        'arguments',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 passive,
-                 durable,
-                 exclusive,
-                 auto_delete,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            queue,
-            passive,
-            durable,
-            exclusive,
-            auto_delete,
-            no_wait,
-            arguments,
-        )
+    synchronous = True
 
 
 class QueueDeclareOK(Method):
@@ -811,17 +1207,13 @@ class QueueDeclareOK(Method):
         ("consumer_count", types.Long),
     )
 
-    synchronous = True
+    __slots__ = (
+        'queue',
+        'message_count',
+        'consumer_count',
+    )
 
-    def __init__(self, *,
-                 queue,
-                 message_count,
-                 consumer_count):
-        super().__init__(
-            queue,
-            message_count,
-            consumer_count,
-        )
+    synchronous = True
 
 
 class QueueBind(Method):
@@ -849,31 +1241,24 @@ class QueueBind(Method):
         ("arguments", types.Table),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'exchange',
+        'routing_key',
+        'no_wait',
+        'arguments',
+    )
+
     synchronous = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 exchange,
-                 routing_key,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            queue,
-            exchange,
-            routing_key,
-            no_wait,
-            arguments,
-        )
-
-
-class QueueBindOK(Method):
+
+class QueueBindOK(_EmptyMethod):
     """This method confirms that the bind was successful.
     """
     method_type = (50, 21)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -898,29 +1283,23 @@ class QueueUnbind(Method):
         ("arguments", types.Table),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'exchange',
+        'routing_key',
+        'arguments',
+    )
+
     synchronous = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 exchange,
-                 routing_key,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            queue,
-            exchange,
-            routing_key,
-            arguments,
-        )
-
-
-class QueueUnbindOK(Method):
+
+class QueueUnbindOK(_EmptyMethod):
     """This method confirms that the unbind was successful.
     """
     method_type = (50, 51)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -942,17 +1321,13 @@ class QueuePurge(Method):
         ("no_wait", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'no_wait',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 no_wait):
-        super().__init__(
-            types.Short(),
-            queue,
-            no_wait,
-        )
+    synchronous = True
 
 
 class QueuePurgeOK(Method):
@@ -967,13 +1342,11 @@ class QueuePurgeOK(Method):
         ("message_count", types.Long),
     )
 
-    synchronous = True
+    __slots__ = (
+        'message_count',
+    )
 
-    def __init__(self, *,
-                 message_count):
-        super().__init__(
-            message_count,
-        )
+    synchronous = True
 
 
 class QueueDelete(Method):
@@ -998,21 +1371,15 @@ class QueueDelete(Method):
         ("no_wait", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'if_unused',
+        'if_empty',
+        'no_wait',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 if_unused,
-                 if_empty,
-                 no_wait):
-        super().__init__(
-            types.Short(),
-            queue,
-            if_unused,
-            if_empty,
-            no_wait,
-        )
+    synchronous = True
 
 
 class QueueDeleteOK(Method):
@@ -1027,13 +1394,11 @@ class QueueDeleteOK(Method):
         ("message_count", types.Long),
     )
 
-    synchronous = True
+    __slots__ = (
+        'message_count',
+    )
 
-    def __init__(self, *,
-                 message_count):
-        super().__init__(
-            message_count,
-        )
+    synchronous = True
 
 
 class BasicQos(Method):
@@ -1056,27 +1421,23 @@ class BasicQos(Method):
         ("global", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'prefetch_size',
+        'prefetch_count',
+        'global_',
+    )
 
-    def __init__(self, *,
-                 prefetch_size,
-                 prefetch_count,
-                 global_):
-        super().__init__(
-            prefetch_size,
-            prefetch_count,
-            global_,
-        )
+    synchronous = True
 
 
-class BasicQosOK(Method):
+class BasicQosOK(_EmptyMethod):
     """This method tells the client that the requested QoS levels could be
     handled by the server. The requested QoS applies to all active consumers
     until a new QoS is defined.
     """
     method_type = (60, 11)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -1109,27 +1470,18 @@ class BasicConsume(Method):
         ("arguments", types.Table),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'consumer_tag',
+        'no_local',
+        'no_ack',
+        'exclusive',
+        'no_wait',
+        'arguments',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 consumer_tag,
-                 no_local,
-                 no_ack,
-                 exclusive,
-                 no_wait,
-                 arguments):
-        super().__init__(
-            types.Short(),
-            queue,
-            consumer_tag,
-            no_local,
-            no_ack,
-            exclusive,
-            no_wait,
-            arguments,
-        )
+    synchronous = True
 
 
 class BasicConsumeOK(Method):
@@ -1145,13 +1497,11 @@ class BasicConsumeOK(Method):
         ("consumer_tag", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'consumer_tag',
+    )
 
-    def __init__(self, *,
-                 consumer_tag):
-        super().__init__(
-            consumer_tag,
-        )
+    synchronous = True
 
 
 class BasicCancel(Method):
@@ -1179,15 +1529,12 @@ class BasicCancel(Method):
         ("no_wait", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'consumer_tag',
+        'no_wait',
+    )
 
-    def __init__(self, *,
-                 consumer_tag,
-                 no_wait):
-        super().__init__(
-            consumer_tag,
-            no_wait,
-        )
+    synchronous = True
 
 
 class BasicCancelOK(Method):
@@ -1202,13 +1549,11 @@ class BasicCancelOK(Method):
         ("consumer_tag", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'consumer_tag',
+    )
 
-    def __init__(self, *,
-                 consumer_tag):
-        super().__init__(
-            consumer_tag,
-        )
+    synchronous = True
 
 
 class BasicPublish(Method):
@@ -1234,24 +1579,18 @@ class BasicPublish(Method):
         ("immediate", types.Bit),
     )
 
+    __slots__ = (
+        'reserved_1',
+        'exchange',
+        'routing_key',
+        'mandatory',
+        'immediate',
+    )
+
     synchronous = False
 
     content = True
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 exchange,
-                 routing_key,
-                 mandatory,
-                 immediate):
-        super().__init__(
-            types.Short(),
-            exchange,
-            routing_key,
-            mandatory,
-            immediate,
-        )
-
 
 class BasicReturn(Method):
     """This method returns an undeliverable message that was published with
@@ -1274,22 +1613,17 @@ class BasicReturn(Method):
         ("routing_key", types.Shortstr),
     )
 
+    __slots__ = (
+        'reply_code',
+        'reply_text',
+        'exchange',
+        'routing_key',
+    )
+
     synchronous = False
 
     content = True
 
-    def __init__(self, *,
-                 reply_code,
-                 reply_text,
-                 exchange,
-                 routing_key):
-        super().__init__(
-            reply_code,
-            reply_text,
-            exchange,
-            routing_key,
-        )
-
 
 class BasicDeliver(Method):
     """This method delivers a message to the client, via a consumer. In the
@@ -1314,24 +1648,18 @@ class BasicDeliver(Method):
         ("routing_key", types.Shortstr),
     )
 
+    __slots__ = (
+        'consumer_tag',
+        'delivery_tag',
+        'redelivered',
+        'exchange',
+        'routing_key',
+    )
+
     synchronous = False
 
     content = True
 
-    def __init__(self, *,
-                 consumer_tag,
-                 delivery_tag,
-                 redelivered,
-                 exchange,
-                 routing_key):
-        super().__init__(
-            consumer_tag,
-            delivery_tag,
-            redelivered,
-            exchange,
-            routing_key,
-        )
-
 
 class BasicGet(Method):
     """This method provides a direct access to the messages in a queue using a
@@ -1351,17 +1679,13 @@ class BasicGet(Method):
         ("no_ack", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+        'queue',
+        'no_ack',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None,
-                 queue,
-                 no_ack):
-        super().__init__(
-            types.Short(),
-            queue,
-            no_ack,
-        )
+    synchronous = True
 
 
 class BasicGetOK(Method):
@@ -1386,24 +1710,18 @@ class BasicGetOK(Method):
         ("message_count", types.Long),
     )
 
+    __slots__ = (
+        'delivery_tag',
+        'redelivered',
+        'exchange',
+        'routing_key',
+        'message_count',
+    )
+
     synchronous = True
 
     content = True
 
-    def __init__(self, *,
-                 delivery_tag,
-                 redelivered,
-                 exchange,
-                 routing_key,
-                 message_count):
-        super().__init__(
-            delivery_tag,
-            redelivered,
-            exchange,
-            routing_key,
-            message_count,
-        )
-
 
 class BasicGetEmpty(Method):
     """This method tells the client that the queue has no messages available
@@ -1418,13 +1736,11 @@ class BasicGetEmpty(Method):
         ("reserved_1", types.Shortstr),
     )
 
-    synchronous = True
+    __slots__ = (
+        'reserved_1',
+    )
 
-    def __init__(self, *,
-                 reserved_1=None):
-        super().__init__(
-            types.Shortstr(),
-        )
+    synchronous = True
 
 
 class BasicAck(Method):
@@ -1445,15 +1761,12 @@ class BasicAck(Method):
         ("multiple", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'delivery_tag',
+        'multiple',
+    )
 
-    def __init__(self, *,
-                 delivery_tag,
-                 multiple):
-        super().__init__(
-            delivery_tag,
-            multiple,
-        )
+    synchronous = False
 
 
 class BasicReject(Method):
@@ -1472,15 +1785,12 @@ class BasicReject(Method):
         ("requeue", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'delivery_tag',
+        'requeue',
+    )
 
-    def __init__(self, *,
-                 delivery_tag,
-                 requeue):
-        super().__init__(
-            delivery_tag,
-            requeue,
-        )
+    synchronous = False
 
 
 class BasicRecoverAsync(Method):
@@ -1497,13 +1807,11 @@ class BasicRecoverAsync(Method):
         ("requeue", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'requeue',
+    )
 
-    def __init__(self, *,
-                 requeue):
-        super().__init__(
-            requeue,
-        )
+    synchronous = False
 
 
 class BasicRecover(Method):
@@ -1520,21 +1828,19 @@ class BasicRecover(Method):
         ("requeue", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'requeue',
+    )
 
-    def __init__(self, *,
-                 requeue):
-        super().__init__(
-            requeue,
-        )
+    synchronous = False
 
 
-class BasicRecoverOK(Method):
+class BasicRecoverOK(_EmptyMethod):
     """This method acknowledges a Basic.Recover method.
     """
     method_type = (60, 111)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -1560,66 +1866,62 @@ class BasicNack(Method):
         ("requeue", types.Bit),
     )
 
-    synchronous = False
+    __slots__ = (
+        'delivery_tag',
+        'multiple',
+        'requeue',
+    )
 
-    def __init__(self, *,
-                 delivery_tag,
-                 multiple,
-                 requeue):
-        super().__init__(
-            delivery_tag,
-            multiple,
-            requeue,
-        )
+    synchronous = False
 
 
-class TxSelect(Method):
+class TxSelect(_EmptyMethod):
     """This method sets the channel to use standard transactions. The client
     must use this method at least once on a channel before using the Commit or
     Rollback methods.
     """
     method_type = (90, 10)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-class TxSelectOK(Method):
+class TxSelectOK(_EmptyMethod):
     """This method confirms to the client that the channel was successfully
     set to use standard transactions.
     """
     method_type = (90, 11)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-class TxCommit(Method):
+class TxCommit(_EmptyMethod):
     """This method commits all message publications and acknowledgments
     performed in the current transaction. A new transaction starts immediately
     after a commit.
     """
     method_type = (90, 20)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-class TxCommitOK(Method):
+class TxCommitOK(_EmptyMethod):
     """This method confirms to the client that the commit succeeded. Note that
     if a commit fails, the server raises a channel exception.
     """
     method_type = (90, 21)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-class TxRollback(Method):
+class TxRollback(_EmptyMethod):
     """This method abandons all message publications and acknowledgments
     performed in the current transaction. A new transaction starts immediately
     after a rollback. Note that unacked messages will not be automatically
@@ -1628,18 +1930,18 @@ class TxRollback(Method):
     """
     method_type = (90, 30)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-class TxRollbackOK(Method):
+class TxRollbackOK(_EmptyMethod):
     """This method confirms to the client that the rollback succeeded. Note
     that if an rollback fails, the server raises a channel exception.
     """
     method_type = (90, 31)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
@@ -1657,86 +1959,26 @@ class ConfirmSelect(Method):
         ("nowait", types.Bit),
     )
 
-    synchronous = True
+    __slots__ = (
+        'nowait',
+    )
 
-    def __init__(self, *,
-                 nowait):
-        super().__init__(
-            nowait,
-        )
+    synchronous = True
 
 
-class ConfirmSelectOK(Method):
+class ConfirmSelectOK(_EmptyMethod):
     """This method confirms to the client that the channel was successfully
     set to use publisher acknowledgements.
     """
     method_type = (85, 11)
 
-    field_info = ()
+    __slots__ = ()
 
     synchronous = True
 
 
-# Method type -> class dispatch table
-METHODS = {
-    (10, 10): ConnectionStart,
-    (10, 11): ConnectionStartOK,
-    (10, 20): ConnectionSecure,
-    (10, 21): ConnectionSecureOK,
-    (10, 30): ConnectionTune,
-    (10, 31): ConnectionTuneOK,
-    (10, 40): ConnectionOpen,
-    (10, 41): ConnectionOpenOK,
-    (10, 50): ConnectionClose,
-    (10, 51): ConnectionCloseOK,
-    (20, 10): ChannelOpen,
-    (20, 11): ChannelOpenOK,
-    (20, 20): ChannelFlow,
-    (20, 21): ChannelFlowOK,
-    (20, 40): ChannelClose,
-    (20, 41): ChannelCloseOK,
-    (40, 10): ExchangeDeclare,
-    (40, 11): ExchangeDeclareOK,
-    (40, 20): ExchangeDelete,
-    (40, 21): ExchangeDeleteOK,
-    (40, 30): ExchangeBind,
-    (40, 31): ExchangeBindOK,
-    (40, 40): ExchangeUnbind,
-    (40, 51): ExchangeUnbindOK,
-    (50, 10): QueueDeclare,
-    (50, 11): QueueDeclareOK,
-    (50, 20): QueueBind,
-    (50, 21): QueueBindOK,
-    (50, 50): QueueUnbind,
-    (50, 51): QueueUnbindOK,
-    (50, 30): QueuePurge,
-    (50, 31): QueuePurgeOK,
-    (50, 40): QueueDelete,
-    (50, 41): QueueDeleteOK,
-    (60, 10): BasicQos,
-    (60, 11): BasicQosOK,
-    (60, 20): BasicConsume,
-    (60, 21): BasicConsumeOK,
-    (60, 30): BasicCancel,
-    (60, 31): BasicCancelOK,
-    (60, 40): BasicPublish,
-    (60, 50): BasicReturn,
-    (60, 60): BasicDeliver,
-    (60, 70): BasicGet,
-    (60, 71): BasicGetOK,
-    (60, 72): BasicGetEmpty,
-    (60, 80): BasicAck,
-    (60, 90): BasicReject,
-    (60, 100): BasicRecoverAsync,
-    (60, 110): BasicRecover,
-    (60, 111): BasicRecoverOK,
-    (60, 120): BasicNack,
-    (90, 10): TxSelect,
-    (90, 11): TxSelectOK,
-    (90, 20): TxCommit,
-    (90, 21): TxCommitOK,
-    (90, 30): TxRollback,
-    (90, 31): TxRollbackOK,
-    (85, 10): ConfirmSelect,
-    (85, 11): ConfirmSelectOK,
-}
+# `(class_id << 8) | method_id` of every synchronous method, the set
+# counterpart of `SYNCHRONOUS_FLAGS`.
+SYNCHRONOUS_KEYS = frozenset(method_cls.method_key
+                             for method_cls in METHODS.values()
+                             if method_cls.synchronous)
@@ -0,0 +1,12 @@
+# Declarations augmenting types.py when it's compiled with Cython.
+import cython
+
+
+@cython.locals(offset=Py_ssize_t, end=Py_ssize_t, consumed=Py_ssize_t,
+               result=dict)
+cpdef dict _unpack_table_items(buffer)
+
+
+@cython.locals(offset=Py_ssize_t, end=Py_ssize_t, consumed=Py_ssize_t,
+               result=list)
+cpdef list _unpack_array_items(buffer)
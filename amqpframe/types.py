@@ -53,20 +53,66 @@ import collections
 import collections.abc
 
 
+class Cursor:
+    """Read-only stream over a buffer, starting at `offset`.
+
+    Type parsers only ever `read` from their stream, so this is
+    enough to feed them a buffer without wrapping it in `io.BytesIO`;
+    reads are zero-copy slices of the buffer.
+    """
+
+    __slots__ = ('_view', '_pos')
+
+    def __init__(self, buffer, offset=0):
+        self._view = memoryview(buffer)
+        self._pos = offset
+
+    def read(self, size=-1):
+        start = self._pos
+        end = len(self._view)
+        if size is not None and 0 <= size < end - start:
+            end = start + size
+        self._pos = end
+        return self._view[start:end]
+
+    def tell(self):
+        return self._pos
+
+
 class BaseType:
 
+    __slots__ = ()
+
     TABLE_LABEL = None
 
     _STRUCT_FMT = None
     _STRUCT_SIZE = None
+    # Compiled from `_STRUCT_FMT` once, when the subclass is created
+    _STRUCT = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('_STRUCT_FMT') is not None:
+            cls._STRUCT = struct.Struct('!' + cls._STRUCT_FMT)
 
     def pack(self):
-        return struct.pack('!' + self._STRUCT_FMT, self)
+        return self._STRUCT.pack(self)
+
+    def pack_into(self, buf: bytearray):
+        # Same as `pack`, but appends to `buf`.
+        buf += self.pack()
 
     @classmethod
     def unpack(cls, stream: io.BytesIO):
         raw = stream.read(cls._STRUCT_SIZE)
-        return struct.unpack('!' + cls._STRUCT_FMT, raw)[0], cls._STRUCT_SIZE
+        return cls._STRUCT.unpack(raw)[0], cls._STRUCT_SIZE
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        # Same as `unpack`, but reads in place from `buffer` at `offset`.
+        if cls._STRUCT is None:
+            return cls.unpack(Cursor(buffer, offset))
+        return cls._STRUCT.unpack_from(buffer, offset)[0], cls._STRUCT_SIZE
 
     def to_bytestream(self, stream: io.BytesIO):
         stream.write(self.pack())
@@ -74,14 +120,56 @@ class BaseType:
     @classmethod
     def from_bytestream(cls, stream: io.BytesIO):
         value, _ = cls.unpack(stream)
-        return cls(value)
+        return value if isinstance(value, cls) else cls(value)
 
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__, self)
 
 
+def _intern(count):
+    """Class decorator interning instances for values in `range(count)`.
+
+    `from_bytestream` of the decorated class hands out the shared
+    instances instead of allocating a new one per value read, which pays
+    off for small integers read for every frame (frame types, channel,
+    class and method ids).
+    """
+    def decorator(cls):
+        interned = tuple(cls(value) for value in range(count))
+
+        def from_bytestream(klass, stream: io.BytesIO):
+            value, _ = klass.unpack(stream)
+            if klass is cls and value < count:
+                return interned[value]
+            return klass(value)
+
+        cls.from_bytestream = classmethod(from_bytestream)
+        return cls
+    return decorator
+
+
+def _ranged_int_new(min_value, max_value):
+    """Build `__new__` of an integer type checking values against
+    `min_value` and `max_value`, bound once instead of looked up as class
+    attributes per instance.
+    """
+    def __new__(cls, *args, **kwargs):
+        value = int.__new__(cls, *args, **kwargs)
+        if min_value <= value <= max_value:
+            return value
+        raise ValueError('value {} must be in range: {}, {}'.format(
+            int(value), min_value, max_value
+        ))
+    return staticmethod(__new__)
+
+
+_BOOL_STRUCT = struct.Struct('!?')
+
+
 class Bool(BaseType):
 
+    __slots__ = ('_value',)
+
     TABLE_LABEL = b't'
 
     def __init__(self, value=False):
@@ -92,40 +180,33 @@ class Bool(BaseType):
     # used when packing/unpacking happens elsewhere
     # damn you AMQP creators who decided to save a couple of bytes ;(
     def pack(self):
-        return struct.pack('!?', self._value)
+        return _BOOL_STRUCT.pack(self._value)
 
     @classmethod
     def unpack(cls, stream):
-        return struct.unpack('!?', stream.read(1))[0], 1
+        return _BOOL_STRUCT.unpack(stream.read(1))[0], 1
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        return _BOOL_STRUCT.unpack_from(buffer, offset)[0], 1
 
+    # Bits are packed as a single big-endian integer, the first bit being
+    # the least significant one, so the first eight go to the last octet.
     @classmethod
     def pack_many(cls, values):
-        if not values:
-            return b''
-        result = 0
-        bitshift = 0
-        for val in values:
-            if val:
-                result |= (1 << bitshift)
-            bitshift += 1
-        bytes_count = len(values) // 8
-        if len(values) % 8 != 0:
-            bytes_count += 1
-        return result.to_bytes(bytes_count, 'big')
+        packed = bytearray((len(values) + 7) >> 3)
+        for i, value in enumerate(values):
+            if value:
+                packed[-1 - (i >> 3)] |= 1 << (i & 7)
+        return bytes(packed)
 
     @classmethod
     def unpack_many(cls, stream, number_of_bits):
-        if not number_of_bits:
-            return []
-        bytes_count = number_of_bits // 8
-        if number_of_bits % 8 != 0:
-            bytes_count += 1
-        bits = int.from_bytes(stream.read(bytes_count), 'big')
-        result = []
-        for i in range(number_of_bits):
-            value = bits & (1 << i)
-            result.append(cls(value))
-        return result
+        packed = stream.read((number_of_bits + 7) >> 3)
+        bits = [bit for octet in reversed(packed)
+                for bit in _OCTET_BITS[octet]]
+        del bits[number_of_bits:]
+        return bits if cls is Bool else [cls(bit) for bit in bits]
 
     @classmethod
     def many_to_bytestream(cls, bools, stream):
@@ -147,6 +228,13 @@ class Bool(BaseType):
 
 Bit = Bool
 
+# Octet -> its eight bits (least significant first) as shared `Bool`s
+_BOOLS = (Bool(False), Bool(True))
+_OCTET_BITS = tuple(
+    tuple(_BOOLS[(octet >> bit) & 1] for bit in range(8))
+    for octet in range(256)
+)
+
 
 class SignedByte(BaseType, int):
     TABLE_LABEL = b'b'
@@ -157,15 +245,10 @@ class SignedByte(BaseType, int):
     _STRUCT_FMT = 'b'
     _STRUCT_SIZE = 1
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 
+@_intern(256)
 class UnsignedByte(BaseType, int):
     TABLE_LABEL = b'B'
 
@@ -175,13 +258,7 @@ class UnsignedByte(BaseType, int):
     _STRUCT_FMT = 'B'
     _STRUCT_SIZE = 1
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 Octet = UnsignedByte
 
@@ -195,15 +272,10 @@ class SignedShort(BaseType, int):
     _STRUCT_FMT = 'h'
     _STRUCT_SIZE = 2
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 
+@_intern(256)
 class UnsignedShort(BaseType, int):
     TABLE_LABEL = b'u'
 
@@ -213,13 +285,7 @@ class UnsignedShort(BaseType, int):
     _STRUCT_FMT = 'H'
     _STRUCT_SIZE = 2
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 Short = UnsignedShort
 
@@ -233,13 +299,7 @@ class SignedLong(BaseType, int):
     _STRUCT_FMT = 'l'
     _STRUCT_SIZE = 4
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 
 class UnsignedLong(BaseType, int):
@@ -251,13 +311,7 @@ class UnsignedLong(BaseType, int):
     _STRUCT_FMT = 'L'
     _STRUCT_SIZE = 4
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 Long = UnsignedLong
 
@@ -271,13 +325,7 @@ class SignedLongLong(BaseType, int):
     _STRUCT_FMT = 'q'
     _STRUCT_SIZE = 8
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 
 class UnsignedLongLong(BaseType, int):
@@ -290,13 +338,7 @@ class UnsignedLongLong(BaseType, int):
     _STRUCT_FMT = 'Q'
     _STRUCT_SIZE = 8
 
-    def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
-        if not cls.MIN <= value <= cls.MAX:
-            raise ValueError('value {} must be in range: {}, {}'.format(
-                value, cls.MIN, cls.MAX
-            ))
-        return value
+    __new__ = _ranged_int_new(MIN, MAX)
 
 Longlong = UnsignedLongLong
 
@@ -308,14 +350,37 @@ class Float(BaseType, float):
     _STRUCT_SIZE = 4
 
     def __new__(cls, *args, **kwargs):
-        value = super().__new__(cls, *args, **kwargs)
+        if len(args) == 1 and not kwargs and type(args[0]) is cls:
+            # Rounded already
+            return args[0]
+        # Rounded to single precision before the instance is created.
+        # Not `float(...)`: Cython would type `value` as a C double.
+        value = float.__new__(float, *args, **kwargs)
         if math.isnan(value):
             raise ValueError
         try:
-            value = struct.unpack('!f', struct.pack('!f', value))[0]
-            return super().__new__(cls, value)
+            value = cls._STRUCT.unpack(cls._STRUCT.pack(value))[0]
         except OverflowError:
             raise ValueError
+        return super().__new__(cls, value)
+
+    @classmethod
+    def _from_single(cls, value):
+        # Values read from the wire are single precision already,
+        # there is no need to round them again.
+        if math.isnan(value):
+            raise ValueError
+        return float.__new__(cls, value)
+
+    @classmethod
+    def unpack(cls, stream: io.BytesIO):
+        value, consumed = super().unpack(stream)
+        return cls._from_single(value), consumed
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        value, consumed = super().unpack_from(buffer, offset)
+        return cls._from_single(value), consumed
 
 
 class Double(BaseType, float):
@@ -325,14 +390,15 @@ class Double(BaseType, float):
     _STRUCT_SIZE = 8
 
     def __new__(cls, *args, **kwargs):
+        # Python floats are doubles already, there is nothing to round.
         value = super().__new__(cls, *args, **kwargs)
         if math.isnan(value):
             raise ValueError
-        try:
-            value = struct.unpack('!d', struct.pack('!d', value))[0]
-            return super().__new__(cls, value)
-        except OverflowError:
-            raise ValueError
+        return value
+
+
+# Scale (UnsignedByte) and value (UnsignedLong) of a decimal
+_DECIMAL_STRUCT = struct.Struct('!BL')
 
 
 class Decimal(BaseType, decimal.Decimal):
@@ -355,23 +421,20 @@ class Decimal(BaseType, decimal.Decimal):
         raise ValueError('bad decimal value: {!r}'.format(value))
 
     def pack(self):
-        sign, digits, exponent = self.as_tuple()
-        value = 0
-        for digit in digits:
-            value = value * 10 + digit
-        if sign:
-            value = -value
-        return UnsignedByte(-exponent).pack() + UnsignedLong(value).pack()
+        exponent = self.as_tuple().exponent
+        # Shifting the point out gives the signed significand as is.
+        value = int(self.scaleb(-exponent))
+        try:
+            return _DECIMAL_STRUCT.pack(-exponent, value)
+        except struct.error:
+            raise ValueError('bad decimal value: {}'.format(self))
 
     @classmethod
     def unpack(cls, stream: io.BytesIO):
-        total = 0
-        exponent, consumed = UnsignedByte.unpack(stream)
-        total += consumed
-        value, consumed = UnsignedLong.unpack(stream)
-        total += consumed
+        raw = stream.read(_DECIMAL_STRUCT.size)
+        exponent, value = _DECIMAL_STRUCT.unpack(raw)
         value = decimal.Decimal(value) / decimal.Decimal(10 ** exponent)
-        return cls(value), total
+        return cls(value), _DECIMAL_STRUCT.size
 
 
 class ShortStr(BaseType, bytes):
@@ -397,11 +460,24 @@ class ShortStr(BaseType, bytes):
     def pack(self):
         return UnsignedByte(len(self)).pack() + self
 
+    def pack_into(self, buf: bytearray):
+        buf.append(len(self))
+        buf += self
+
+    # Strings read are taken as they are, without validating them
+    # as `__new__` does for the values given by users.
     @classmethod
     def unpack(cls, stream: io.BytesIO):
         str_len, consumed = UnsignedByte.unpack(stream)
         value = stream.read(str_len)
-        return cls(value), consumed + str_len
+        return bytes.__new__(cls, value), consumed + str_len
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        str_len = buffer[offset]
+        offset += 1
+        value = buffer[offset:offset + str_len]
+        return bytes.__new__(cls, value), 1 + str_len
 
 Shortstr = ShortStr
 
@@ -433,12 +509,24 @@ class LongStr(BaseType, bytes):
         str_len, consumed = UnsignedLong.unpack(stream)
         value = stream.read(str_len)
         assert len(value) == str_len
-        return cls(value), consumed + str_len
+        return bytes.__new__(cls, value), consumed + str_len
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        # Sliced through a memoryview, the value is copied only once,
+        # into the instance.
+        str_len, consumed = UnsignedLong.unpack_from(buffer, offset)
+        offset += consumed
+        value = memoryview(buffer)[offset:offset + str_len]
+        assert len(value) == str_len
+        return bytes.__new__(cls, value), consumed + str_len
 
 Longstr = LongStr
 
 
 class Void(BaseType):
+    __slots__ = ('_value',)
+
     TABLE_LABEL = b'V'
 
     def __init__(self, value=None):
@@ -483,7 +571,15 @@ class ByteArray(BaseType, bytes):
         str_len, consumed = UnsignedLong.unpack(stream)
         value = stream.read(str_len)
         assert len(value) == str_len
-        return cls(value), consumed + str_len
+        return bytes.__new__(cls, value), consumed + str_len
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        str_len, consumed = UnsignedLong.unpack_from(buffer, offset)
+        offset += consumed
+        value = memoryview(buffer)[offset:offset + str_len]
+        assert len(value) == str_len
+        return bytes.__new__(cls, value), consumed + str_len
 
 
 class Timestamp(datetime.datetime, BaseType):
@@ -492,6 +588,9 @@ class Timestamp(datetime.datetime, BaseType):
     def __new__(cls, *args, **kwargs):
         if len(args) == 1 and isinstance(args[0], datetime.datetime):
             value = args[0]
+            if isinstance(value, cls):
+                # Already checked, and immutable.
+                return value
             args = (value.year, value.month, value.day,
                     value.hour, value.minute, value.second,
                     value.microsecond, value.tzinfo)
@@ -507,8 +606,7 @@ class Timestamp(datetime.datetime, BaseType):
     @classmethod
     def unpack(cls, stream: io.BytesIO):
         value, consumed = UnsignedLongLong.unpack(stream)
-        date = datetime.datetime.fromtimestamp(value)
-        return cls(date), consumed
+        return cls.fromtimestamp(value), consumed
 
     def __eq__(self, other):
         diff = abs(self - other)
@@ -516,7 +614,87 @@ class Timestamp(datetime.datetime, BaseType):
         return diff <= datetime.timedelta(seconds=1)
 
 
+# Tables use a handful of distinct keys in practice (header names),
+# so keys are validated and allocated once per distinct value.
+_table_key = functools.lru_cache(maxsize=1024)(ShortStr)
+
+
+# Tables and arrays are packed after a placeholder of their length,
+# which is filled in once the items are packed.
+_NO_LENGTH = bytes(UnsignedLong._STRUCT_SIZE)
+
+
+def _pack_length_into(buf, start):
+    length = len(buf) - start - UnsignedLong._STRUCT_SIZE
+    UnsignedLong._STRUCT.pack_into(buf, start, UnsignedLong(length))
+
+
+# Loops over the items of tables and arrays, the local types of these are
+# declared in types.pxd for the compiled module.
+def _unpack_table_items(buffer):
+    result = {}
+    offset = 0
+    end = len(buffer)
+    while offset < end:
+        key_len = buffer[offset]
+        offset += 1 + key_len
+        key = _table_key(bytes(buffer[offset - key_len:offset]))
+
+        decoder = _TABLE_VALUE_DECODERS[buffer[offset]]
+        if decoder is None:
+            raise ValueError('unknown table value label {!r}'.format(
+                bytes(buffer[offset:offset + 1])
+            ))
+        result[key], consumed = decoder(buffer, offset + 1)
+        offset += 1 + consumed
+    return result
+
+
+def _unpack_array_items(buffer):
+    offset = 0
+    end = len(buffer)
+    if end:
+        result = _unpack_numeric_array_items(buffer)
+        if result is not None:
+            return result
+
+    result = []
+    while offset < end:
+        decoder = _TABLE_VALUE_DECODERS[buffer[offset]]
+        if decoder is None:
+            raise ValueError('unknown table value label {!r}'.format(
+                bytes(buffer[offset:offset + 1])
+            ))
+        value, consumed = decoder(buffer, offset + 1)
+        offset += 1 + consumed
+        result.append(value)
+    return result
+
+
+def _unpack_numeric_array_items(buffer):
+    # Arrays of numbers of a single type (e.g. delivery tags) are read
+    # as a whole, each item being a label and a value of the same size.
+    # Returns None for arrays of any other kind.
+    batch = _NUMERIC_ARRAY_ITEMS[buffer[0]]
+    if batch is None or len(buffer) % batch.size:
+        return None
+    label = buffer[0]
+    amqptype = _TABLE_LABEL_TYPES[label]
+    is_float = issubclass(amqptype, float)
+    new = float.__new__ if is_float else int.__new__
+    result = []
+    for item_label, value in batch.iter_unpack(buffer):
+        if item_label != label:
+            return None
+        if is_float and math.isnan(value):
+            raise ValueError
+        result.append(new(amqptype, value))
+    return result
+
+
 class Table(BaseType, collections.abc.MutableMapping):
+    __slots__ = ('_value',)
+
     TABLE_LABEL = b'F'
 
     def __init__(self, *args, **kwargs):
@@ -525,59 +703,55 @@ class Table(BaseType, collections.abc.MutableMapping):
         validated = {}
         for key, value in value.items():
             if not isinstance(key, ShortStr):
-                key = ShortStr(key)
+                key = _table_key(key)
             if not isinstance(value, BaseType):
-                # pylint: disable=E1111
-                value = _py_type_to_amqp_type(value)
+                value = _to_amqp_type(value)
             validated[key] = value
         self._value = validated
 
     def pack(self):
-        stream = io.BytesIO()
+        buf = bytearray()
+        self.pack_into(buf)
+        return bytes(buf)
+
+    def pack_into(self, buf: bytearray):
+        start = len(buf)
+        buf += _NO_LENGTH
         for key, value in self._value.items():
-            key.to_bytestream(stream)
-            stream.write(value.TABLE_LABEL)
-            value.to_bytestream(stream)
-        buffer = stream.getvalue()
-        return UnsignedLong(len(buffer)).pack() + buffer
+            key.pack_into(buf)
+            buf += value.TABLE_LABEL
+            value.pack_into(buf)
+        _pack_length_into(buf, start)
 
     @classmethod
     def unpack(cls, stream: io.BytesIO):
-        result = {}
-        table_len, initial = UnsignedLong.unpack(stream)
-        consumed = initial
-
-        # pylint: disable=C0103
-        while consumed < initial + table_len:
-            key, x = ShortStr.unpack(stream)
-            consumed += x
+        # The whole table is read at once, its items are unpacked in place.
+        table_len, consumed = UnsignedLong.unpack(stream)
+        items = stream.read(table_len)
+        return _unpack_table_items(items), consumed + table_len
 
-            label = stream.read(1)
-            consumed += 1
-
-            amqptype = TABLE_LABEL_TO_CLS[label]
-            value, x = amqptype.unpack(stream)
-            consumed += x
-
-            result[key] = amqptype(value)
-        return result, consumed
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        table_len, consumed = UnsignedLong.unpack_from(buffer, offset)
+        offset += consumed
+        items = memoryview(buffer)[offset:offset + table_len]
+        return _unpack_table_items(items), consumed + table_len
 
     def __getitem__(self, key):
         if isinstance(key, (str, bytes)):
-            key = ShortStr(key)
+            key = _table_key(key)
         return self._value[key]
 
     def __setitem__(self, key, value):
         if isinstance(key, (str, bytes)):
-            key = ShortStr(key)
+            key = _table_key(key)
         if not isinstance(value, BaseType):
-            # pylint: disable=E1111
-            value = _py_type_to_amqp_type(value)
+            value = _to_amqp_type(value)
         self._value[key] = value
 
     def __delitem__(self, key):
         if isinstance(key, (str, bytes)):
-            key = ShortStr(key)
+            key = _table_key(key)
         del self._value[key]
 
     def __iter__(self):
@@ -586,11 +760,39 @@ class Table(BaseType, collections.abc.MutableMapping):
     def __len__(self):
         return len(self._value)
 
+    # MutableMapping provides the methods below on top of the ones above,
+    # these go to the underlying dict at once.
+    def __contains__(self, key):
+        if isinstance(key, (str, bytes)):
+            key = _table_key(key)
+        return key in self._value
+
+    def get(self, key, default=None):
+        if isinstance(key, (str, bytes)):
+            key = _table_key(key)
+        return self._value.get(key, default)
+
+    def pop(self, key, *default):
+        if isinstance(key, (str, bytes)):
+            key = _table_key(key)
+        return self._value.pop(key, *default)
+
+    def keys(self):
+        return self._value.keys()
+
+    def items(self):
+        return self._value.items()
+
+    def values(self):
+        return self._value.values()
+
     def __str__(self):
         return str(self._value)
 
 
 class Array(BaseType, collections.abc.MutableSequence):
+    __slots__ = ('_value',)
+
     TABLE_LABEL = b'A'
 
     def __init__(self, *args, **kwargs):
@@ -599,44 +801,43 @@ class Array(BaseType, collections.abc.MutableSequence):
         validated = []
         for item in value:
             if not isinstance(item, BaseType):
-                # pylint: disable=E1111
-                item = _py_type_to_amqp_type(item)
+                item = _to_amqp_type(item)
             validated.append(item)
         self._value = validated
 
     def pack(self):
-        stream = io.BytesIO()
+        buf = bytearray()
+        self.pack_into(buf)
+        return bytes(buf)
+
+    def pack_into(self, buf: bytearray):
+        start = len(buf)
+        buf += _NO_LENGTH
         for value in self._value:
-            stream.write(value.TABLE_LABEL)
-            value.to_bytestream(stream)
-        buffer = stream.getvalue()
-        return UnsignedLong(len(buffer)).pack() + buffer
+            buf += value.TABLE_LABEL
+            value.pack_into(buf)
+        _pack_length_into(buf, start)
 
     @classmethod
     def unpack(cls, stream: io.BytesIO):
-        result = []
+        # The whole array is read at once, its items are unpacked in place.
         array_len, consumed = UnsignedLong.unpack(stream)
-        initial = consumed
-
-        # pylint: disable=C0103
-        while consumed < (array_len + initial):
-            label = stream.read(1)
-            consumed += 1
+        items = stream.read(array_len)
+        return _unpack_array_items(items), consumed + array_len
 
-            amqptype = TABLE_LABEL_TO_CLS[label]
-            value, x = amqptype.unpack(stream)
-            consumed += x
-
-            result.append(amqptype(value))
-        return result, consumed
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        array_len, consumed = UnsignedLong.unpack_from(buffer, offset)
+        offset += consumed
+        items = memoryview(buffer)[offset:offset + array_len]
+        return _unpack_array_items(items), consumed + array_len
 
     def __getitem__(self, key):
         return self._value[key]
 
     def __setitem__(self, key, value):
         if not isinstance(value, BaseType):
-            # pylint: disable=E1111
-            value = _py_type_to_amqp_type(value)
+            value = _to_amqp_type(value)
         self._value[key] = value
 
     def __delitem__(self, key):
@@ -650,10 +851,35 @@ class Array(BaseType, collections.abc.MutableSequence):
 
     def insert(self, index, value):
         if not isinstance(value, BaseType):
-            # pylint: disable=E1111
-            value = _py_type_to_amqp_type(value)
+            value = _to_amqp_type(value)
         self._value.insert(index, value)
 
+    # MutableSequence provides the methods below on top of the ones above,
+    # these go to the underlying list at once.
+    def append(self, value):
+        if not isinstance(value, BaseType):
+            value = _to_amqp_type(value)
+        self._value.append(value)
+
+    def extend(self, values):
+        self._value += [value if isinstance(value, BaseType)
+                        else _to_amqp_type(value) for value in values]
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __reversed__(self):
+        return reversed(self._value)
+
+    def __contains__(self, value):
+        return value in self._value
+
+    def index(self, value, *args):
+        return self._value.index(value, *args)
+
+    def count(self, value):
+        return self._value.count(value)
+
     def __hash__(self):
         raise NotImplementedError
 
@@ -698,23 +924,37 @@ def _py_type_to_amqp_float(value):
     return value
 
 
+# Integer types in order of preference, the smallest one holding a value
+# is used for it.
+_INT_TYPES = (SignedByte, UnsignedByte,
+              SignedShort, UnsignedShort,
+              SignedLong, UnsignedLong,
+              SignedLongLong)
+# The same choice made up front, indexed by the bit length of a value
+# (of `~value` for negative values).
+_NON_NEGATIVE_INT_TYPES = tuple(
+    next(cls for cls in _INT_TYPES if cls.MAX.bit_length() >= length)
+    for length in range(64)
+)
+_NEGATIVE_INT_TYPES = tuple(
+    next(cls for cls in _INT_TYPES
+         if cls.MIN < 0 and (~cls.MIN).bit_length() >= length)
+    for length in range(64)
+)
+
+
 @_py_type_to_amqp_type.register(int)
 def _py_type_to_amqp_int(value):
-    last_error = None
-    for cls in (SignedByte, UnsignedByte,
-                SignedShort, UnsignedShort,
-                SignedLong, UnsignedLong,
-                SignedLongLong):
-        try:
-            value = cls(value)
-            last_error = None
-            break
-        except ValueError as exc:
-            last_error = exc
-    if last_error is not None:  # pragma: no cover
-        # pylint: disable=E0702
-        raise last_error
-    return value
+    try:
+        if value >= 0:
+            cls = _NON_NEGATIVE_INT_TYPES[value.bit_length()]
+        else:
+            cls = _NEGATIVE_INT_TYPES[(~value).bit_length()]
+    except IndexError:
+        raise ValueError('value {} is out of range for tables'.format(value))
+    # The value fits the type picked by its bit length, there is no need
+    # to check its range again in `__new__`.
+    return int.__new__(cls, value)
 
 
 @_py_type_to_amqp_type.register(decimal.Decimal)
@@ -743,7 +983,63 @@ def _py_type_to_amqp_none(value):
     return Void(None)
 
 
+# Converters by the exact type of values, the dispatch above is only used
+# for subclasses of the registered types.
+_PY_TYPE_CONVERTERS = {
+    py_type: converter
+    for py_type, converter in _py_type_to_amqp_type.registry.items()
+    if py_type is not object
+}
+
+
+def _to_amqp_type(value):
+    converter = _PY_TYPE_CONVERTERS.get(type(value))
+    if converter is None:
+        return _py_type_to_amqp_type(value)
+    return converter(value)
+
+
 # pylint: disable=E1101
 TABLE_LABEL_TO_CLS = {cls.TABLE_LABEL: cls
                       for cls in BaseType.__subclasses__()
                       if cls.TABLE_LABEL is not None}
+
+
+def _table_value_decoder(amqptype):
+    """Build a function reading an `amqptype` value in place, returning
+    the instance and the number of bytes consumed.
+
+    Integers read can't be out of their type's range, so they're
+    instantiated without the checks of `__new__`.
+    """
+    if issubclass(amqptype, int) and amqptype._STRUCT is not None:
+        unpack_from = amqptype._STRUCT.unpack_from
+        size = amqptype._STRUCT_SIZE
+
+        def decode_int(buffer, offset):
+            return int.__new__(amqptype, unpack_from(buffer, offset)[0]), size
+        return decode_int
+
+    def decode(buffer, offset):
+        value, consumed = amqptype.unpack_from(buffer, offset)
+        if not isinstance(value, amqptype):
+            value = amqptype(value)
+        return value, consumed
+    return decode
+
+
+# Types and value decoders indexed by the label octet as read from
+# a buffer, None for unknown labels.
+_TABLE_LABEL_TYPES = tuple(TABLE_LABEL_TO_CLS.get(bytes((code,)))
+                           for code in range(256))
+_TABLE_VALUE_DECODERS = tuple(
+    None if amqptype is None else _table_value_decoder(amqptype)
+    for amqptype in _TABLE_LABEL_TYPES
+)
+# Array items of numeric types as a label octet and a value, by label.
+_NUMERIC_ARRAY_ITEMS = tuple(
+    struct.Struct('!B' + amqptype._STRUCT_FMT)
+    if (amqptype is not None and issubclass(amqptype, (int, float)) and
+        amqptype._STRUCT is not None) else None
+    for amqptype in _TABLE_LABEL_TYPES
+)
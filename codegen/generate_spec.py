@@ -9,16 +9,18 @@ def load_spec(filename):
     tree = ElementTree.parse(filename)
     methods = get_methods(tree)
     error_classes = get_error_classes(tree)
-    return methods, error_classes
+    reply_codes = get_reply_codes(tree)
+    return methods, error_classes, reply_codes
 
 
 def get_methods(tree):
     classes = get_classes(tree)
     methods = []
     for cname, (cid, cmethods) in classes.items():
-        for mname, (mid, mfields, msupport, synchronous, mdoc) in cmethods.items():  # noqa
+        for mname, (mid, mfields, msupport, synchronous, content, mdoc) in cmethods.items():  # noqa
             name = cname + mname
-            methods.append((name, mdoc, (cid, mid), mfields, synchronous))
+            methods.append((name, mdoc, (cid, mid), mfields, synchronous,
+                            content))
     return methods
 
 
@@ -40,6 +42,18 @@ def get_error_classes(tree):
     return classes
 
 
+def get_reply_codes(tree):
+    codes = []
+    for elem in tree.findall('constant'):
+        name = elem.attrib['name']
+        if 'class' not in elem.attrib and not name.startswith('reply-'):
+            continue
+        # Convert name from foo-bar to FOO_BAR
+        codes.append((name.upper().replace('-', '_'), elem.attrib['value']))
+
+    return codes
+
+
 def get_classes(tree):
     domain_types = {e.attrib['name']: e.attrib['type']
                     for e in tree.findall('domain')}
@@ -63,6 +77,7 @@ def get_classes(tree):
 
             doc = build_docstring(method_elem, fields)
             synchronous = 'synchronous' in method_elem.attrib
+            content = 'content' in method_elem.attrib
 
             method_id = int(method_elem.attrib['index'])
             method_name = (method_elem.attrib['name']
@@ -71,7 +86,7 @@ def get_classes(tree):
                            .replace('-empty', 'Empty')
                            .replace('-async', 'Async'))
             class_methods[method_name] = (method_id, fields, method_support,
-                                          synchronous, doc)
+                                          synchronous, content, doc)
 
         class_id = int(class_elem.attrib['index'])
         classes[class_elem.attrib['name'].capitalize()] = (class_id,
@@ -115,7 +130,7 @@ if __name__ == '__main__':
     methods_template_source = proj_dir + '/codegen/methods.py.tmpl'
     errors_file = proj_dir + '/amqpframe/errors.py'
     errors_template_source = proj_dir + '/codegen/errors.py.tmpl'
-    methods, error_classes = load_spec(spec_source)
+    methods, error_classes, reply_codes = load_spec(spec_source)
 
     env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
 
@@ -135,6 +150,7 @@ if __name__ == '__main__':
     rendered = template.render(
         gendate=gendate,
         gensource=spec,
-        error_classes=error_classes)
+        error_classes=error_classes,
+        reply_codes=reply_codes)
     with open(errors_file, 'w') as f:
         f.write(rendered)
@@ -1,9 +1,29 @@
+import os
+
 import setuptools
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    # Serialization modules are compiled as is when Cython is available,
+    # the pure Python modules are used otherwise (or if compilation fails,
+    # unless AMQPFRAME_REQUIRE_EXTENSIONS is set, see `make extensions`).
+    ext_modules = cythonize(
+        ['amqpframe/frames.py', 'amqpframe/basic.py', 'amqpframe/methods.py',
+         'amqpframe/types.py'],
+        compiler_directives={'language_level': 3},
+    )
+    for extension in ext_modules:
+        extension.optional = not os.environ.get(
+            'AMQPFRAME_REQUIRE_EXTENSIONS')
+
 
 setuptools.setup(
     name='amqpframe',
     version='0.1',
     license='BSD 3-clause',
     packages=setuptools.find_packages(exclude='tests'),
-)
\ No newline at end of file
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,61 @@
+import inspect
+import datetime
+
+import pytest
+
+import amqpframe.basic as ab
+
+
+def test_messages_can_be_instantiated_with_defaults():
+    message = ab.Message()
+
+    assert message.body == b''
+    assert message.content_type == 'application/octet-stream'
+    assert message.content_encoding == 'utf-8'
+    assert message.headers is None
+    assert isinstance(message.timestamp, datetime.datetime)
+    assert list(message.properties) == list(ab.PROPERTIES)
+
+
+def test_message_constructor_source_is_available():
+    source = inspect.getsource(ab.Message.__init__)
+    assert source.startswith('def __init__(self, ')
+    assert 'self.property_values = (' in source
+
+
+def test_message_str_bodies_are_encoded():
+    message = ab.Message('тело', content_encoding='utf-16')
+
+    assert message.body == 'тело'.encode('utf-16')
+    assert message.decoded_body == 'тело'
+
+
+def test_message_properties_are_accessible_as_attributes():
+    timestamp = datetime.datetime(2016, 8, 29)
+    message = ab.Message(b'body', type='type', priority=5,
+                         timestamp=timestamp)
+
+    assert message.type == 'type'
+    assert message.priority == 5
+    assert message.timestamp == timestamp
+    assert message.properties['type'] == 'type'
+
+    message.priority = 1
+    assert message.priority == 1
+    assert message.properties['priority'] == 1
+    assert len(message.property_values) == len(ab.PROPERTIES)
+
+
+def test_message_properties_can_be_changed_through_the_mapping():
+    message = ab.Message(b'body')
+
+    message.properties['priority'] = 5
+    assert message.priority == 5
+    assert message.property_values[list(ab.PROPERTIES).index('priority')] == 5
+
+    del message.properties['priority']
+    assert message.priority is None
+    assert 'priority' in message.properties
+
+    with pytest.raises(KeyError):
+        message.properties['unknown'] = 1
@@ -1,6 +1,12 @@
 import io
+import datetime
 
+import pytest
+
+import amqpframe.basic as ab
 import amqpframe.frames as af
+import amqpframe.methods as am
+import amqpframe.errors as ae
 
 
 def test_HeaderFrame_can_be_packed_unpacked():
@@ -21,7 +27,7 @@ def test_HeaderFrame_can_be_packed_unpacked():
 
 
 def test_HeartbeatFrame_can_be_packed_unpacked():
-    DATA = b'\x08\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\xce'
+    DATA = b'\x08\x00\x00\x00\x00\x00\x00\xce'
 
     stream = io.BytesIO(DATA)
     frame = af.Frame.from_bytestream(stream)
@@ -32,3 +38,136 @@ def test_HeartbeatFrame_can_be_packed_unpacked():
     stream = io.BytesIO()
     frame.to_bytestream(stream)
     assert stream.getvalue() == DATA
+
+
+def test_ContentBodyFrame_can_be_packed_unpacked():
+    DATA = b'\x03\x00\x05\x00\x00\x00\x04body\xce'
+
+    stream = io.BytesIO(DATA)
+    frame = af.Frame.from_bytestream(stream, body_chunk_size=4)
+    assert frame.channel_id == 5
+    assert isinstance(frame, af.ContentBodyFrame)
+    assert frame.payload.data == b'body'
+
+    stream = io.BytesIO()
+    frame.to_bytestream(stream)
+    assert stream.getvalue() == DATA
+
+
+def test_MethodFrame_can_be_packed_unpacked():
+    DATA = b'\x01\x00\x01\x00\x00\x00\x0d\x00\x3c\x00\x50' + \
+        b'\x00\x00\x00\x00\x00\x00\x00\x2a\x01\xce'
+
+    stream = io.BytesIO(DATA)
+    frame = af.Frame.from_bytestream(stream)
+    assert frame.channel_id == 1
+    assert isinstance(frame, af.MethodFrame)
+    assert frame.payload == am.BasicAck(delivery_tag=42, multiple=True)
+
+    stream = io.BytesIO()
+    frame.to_bytestream(stream)
+    assert stream.getvalue() == DATA
+
+
+def test_frames_can_be_serialized_to_iovec():
+    data = memoryview(b'body')
+    message = ab.Message(b'body', content_type='text/plain')
+    header = af.ContentHeaderPayload(60, len(message.body),
+                                     message.properties)
+    for frame in (af.ContentBodyFrame(5, af.ContentBodyPayload(data)),
+                  af.HeartbeatFrame(0, af.HeartbeatPayload()),
+                  af.ContentHeaderFrame(5, header),
+                  af.MethodFrame(5, am.BasicAck(delivery_tag=42,
+                                                multiple=True)),
+                  af.ProtocolHeaderFrame(None,
+                                         af.ProtocolHeaderPayload(0, 9, 1))):
+        stream = io.BytesIO()
+        frame.to_bytestream(stream)
+        assert b''.join(frame.to_iovec()) == stream.getvalue()
+
+
+def test_ContentHeaderFrame_can_be_packed_unpacked():
+    DATA = (b'\x02\x00\x01\x00\x00\x00\x1d'
+            b'\x00<\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\xa0\x00'
+            b'\ntext/plain\x00\x00\x00\x00\xce')
+
+    stream = io.BytesIO(DATA)
+    frame = af.Frame.from_bytestream(stream)
+    assert frame.channel_id == 1
+    assert isinstance(frame, af.ContentHeaderFrame)
+    assert frame.payload.class_id == 60
+    assert frame.payload.body_size == 10
+    assert frame.payload.properties['content_type'] == b'text/plain'
+    assert frame.payload.properties['headers'] == {}
+    assert frame.payload.properties['priority'] is None
+
+    stream = io.BytesIO()
+    frame.to_bytestream(stream)
+    assert stream.getvalue() == DATA
+
+
+def test_ContentHeaderFrame_packs_all_property_types():
+    properties = {
+        'content_type': b'application/json',
+        'content_encoding': b'utf-8',
+        'headers': {b'key': b'value'},
+        'delivery_mode': 2,
+        'priority': 9,
+        'correlation_id': b'correlation',
+        'reply_to': b'reply',
+        'expiration': b'60000',
+        'message_id': b'message',
+        'timestamp': datetime.datetime(2016, 8, 29, 12, 0, 0),
+        'type': b'type',
+        'user_id': b'guest',
+        'app_id': b'app',
+    }
+    assert set(properties) == set(ab.PROPERTIES)
+
+    payload = af.ContentHeaderPayload(60, 42, properties)
+    frame = af.ContentHeaderFrame(1, payload)
+    stream = io.BytesIO()
+    frame.to_bytestream(stream)
+    raw = stream.getvalue()
+
+    unpacked = af.Frame.from_bytestream(io.BytesIO(raw))
+    assert unpacked.payload.body_size == 42
+    assert unpacked.payload.properties == properties
+
+    stream = io.BytesIO()
+    unpacked.to_bytestream(stream)
+    assert stream.getvalue() == raw
+
+
+def test_ContentHeaderPayload_accepts_message_property_values():
+    message = ab.Message(b'body', content_type='text/plain', priority=1)
+
+    raw = []
+    for properties in (message.property_values, message.properties):
+        payload = af.ContentHeaderPayload(60, len(message.body), properties)
+        stream = io.BytesIO()
+        payload.to_bytestream(stream)
+        raw.append(stream.getvalue())
+
+    assert raw[0] == raw[1]
+
+
+@pytest.mark.parametrize('frame_type', [b'\x00', b'\x07', b'\x09'])
+def test_unknown_frame_types_are_rejected(frame_type):
+    stream = io.BytesIO(frame_type + b'\x00\x00\x00\x00\x00\x00\xce')
+    with pytest.raises(ae.FrameError):
+        af.Frame.from_bytestream(stream)
+
+
+@pytest.mark.parametrize('raw', [
+    b'', b'\x01\x00', b'\x01\x00\x00\x00\x00\x00',
+])
+def test_frames_with_truncated_header_are_rejected(raw):
+    with pytest.raises(ae.FrameError):
+        af.Frame.from_bytestream(io.BytesIO(raw))
+
+
+def test_frames_with_bad_frame_end_are_rejected():
+    stream = io.BytesIO(b'\x08\x00\x00\x00\x00\x00\x00\x00')
+    with pytest.raises(ae.FrameError):
+        af.Frame.from_bytestream(stream)
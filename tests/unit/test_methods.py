@@ -1,7 +1,9 @@
 import io
 import operator
 
+import amqpframe.types as at
 import amqpframe.methods as am
+import amqpframe.errors as ae
 
 import pytest
 import hypothesis as h
@@ -27,12 +29,31 @@ def methods(draw, method_cls, generate_arguments):
 
 
 @h.given(hs.data())
-@pytest.mark.parametrize('method_cls', am.Method.__subclasses__())
+@pytest.mark.parametrize('method_cls', list(am.METHODS.values()))
 def test_methods_can_be_instantiated_with_Nones(method_cls, data):
     method = data.draw(methods(method_cls, generate_arguments=False))
     assert method
 
 
+@pytest.mark.parametrize('method_cls', [
+    method_cls for method_cls in am.METHODS.values() if method_cls.field_info
+])
+def test_decoded_numeric_fields_are_plain_ints(method_cls):
+    method = method_cls(**{
+        name: None for name in map(am._arg_name, method_cls.field_names)
+    })
+    raw = method.to_bytes()
+    for decoded in (am.Method.from_bytestream(io.BytesIO(raw)),
+                    am.Method.from_buffer(raw)[0]):
+        assert decoded == method
+        for name, amqptype in method_cls.field_info:
+            value = getattr(decoded, am._arg_name(name))
+            if issubclass(amqptype, int):
+                assert type(value) is int
+            else:
+                assert type(value) is amqptype
+
+
 def test_methods_provide_attribute_access():
     method = am.ExchangeDeclare(
         exchange='exchange', type='direct', passive=False, durable=False,
@@ -47,9 +68,21 @@ def test_methods_provide_attribute_access():
         method.missing
 
 
+def test_method_fields_are_plain_attributes():
+    method = am.BasicQos(prefetch_size=0, prefetch_count=10, global_=True)
+
+    assert method.prefetch_count == 10
+    assert method.global_
+    assert not hasattr(method, '__dict__')
+    assert '__getattr__' not in vars(am.Method)
+    assert am.BasicQos.field_names == ('prefetch_size', 'prefetch_count',
+                                       'global')
+    assert list(method.values) == list(am.BasicQos.field_names)
+
+
 @h.given(hs.data())
 @h.settings(perform_health_check=False)
-@pytest.mark.parametrize('method_cls', am.Method.__subclasses__())
+@pytest.mark.parametrize('method_cls', list(am.METHODS.values()))
 def test_methods_can_be_instantiated_with_arbitrary_arguments(method_cls, data):
     method = data.draw(methods(method_cls, generate_arguments=True))
     assert method
@@ -57,7 +90,7 @@ def test_methods_can_be_instantiated_with_arbitrary_arguments(method_cls, data):
 
 @h.given(hs.data())
 @h.settings(perform_health_check=False)
-@pytest.mark.parametrize('method_cls', am.Method.__subclasses__())
+@pytest.mark.parametrize('method_cls', list(am.METHODS.values()))
 def test_methods_can_be_packed_unpacked_with_arbitrary_arguments(method_cls, data):
     method = data.draw(methods(method_cls, generate_arguments=True))
 
@@ -69,3 +102,165 @@ def test_methods_can_be_packed_unpacked_with_arbitrary_arguments(method_cls, dat
     unpacked = am.Method.from_bytestream(stream)
 
     assert method == unpacked
+
+    unpacked, offset = am.Method.from_buffer(raw)
+
+    assert method == unpacked
+    assert offset == len(raw)
+
+
+def test_methods_can_be_unpacked_from_buffer_at_offset():
+    first = am.BasicAck(delivery_tag=1, multiple=False)
+    second = am.QueueDeclare(
+        queue='queue', passive=False, durable=True, exclusive=False,
+        auto_delete=False, no_wait=False, arguments={'x-max-length': 10},
+    )
+    stream = io.BytesIO()
+    stream.write(b'junk')
+    first.to_bytestream(stream)
+    second.to_bytestream(stream)
+    raw = stream.getvalue()
+
+    method, offset = am.Method.from_buffer(raw, 4)
+    assert method == first
+    method, offset = am.Method.from_buffer(memoryview(raw), offset)
+    assert method == second
+    assert offset == len(raw)
+
+
+@pytest.mark.parametrize('method_type', [
+    (10, 12), (10, 266), (11, 10), (200, 10),
+])
+def test_unknown_methods_are_rejected(method_type):
+    stream = io.BytesIO(am._METHOD_TYPE.pack(*method_type))
+
+    with pytest.raises(ae.CommandInvalid):
+        am.Method.from_bytestream(stream)
+
+
+def test_method_bits_are_packed_into_octets():
+    method = am.QueueDeclare(
+        queue='q', passive=False, durable=True, exclusive=False,
+        auto_delete=True, no_wait=False, arguments={},
+    )
+    raw = method.to_bytes()
+
+    assert raw == (b'\x00\x32\x00\x0a' b'\x00\x00' b'\x01q' b'\x0a'
+                   b'\x00\x00\x00\x00')
+    assert am.Method.from_bytestream(io.BytesIO(raw)) == method
+
+
+def test_method_bits_share_bool_instances_with_types():
+    raw = am.ChannelFlow(active=True).to_bytes()
+    method, _ = am.Method.from_buffer(raw)
+    bit, = at.Bool.unpack_many(io.BytesIO(b'\x01'), 1)
+    assert method.active is bit
+
+
+def test_methods_without_fields_are_shared_instances():
+    raw = am.BasicQosOK().to_bytes()
+
+    first = am.Method.from_bytestream(io.BytesIO(raw))
+    second, _ = am.Method.from_buffer(raw)
+    assert first is second
+    assert first is am.BasicQosOK()
+    assert first is not am.TxCommit()
+    assert am.TxCommit().to_bytes() == b'\x00\x5a\x00\x14'
+
+
+def test_light_methods_are_unpacked_to_plain_values():
+    raw = (am.BasicRecover(requeue=True).to_bytes() +
+           am.QueuePurgeOK(message_count=7).to_bytes() +
+           am.TxCommitOK().to_bytes() +
+           am.BasicAck(delivery_tag=1, multiple=False).to_bytes())
+
+    key, payload, offset = am.Method.light_from_buffer(raw)
+    assert (key, payload) == (am.BasicRecover.method_key, True)
+    key, payload, offset = am.Method.light_from_buffer(raw, offset)
+    assert (key, payload) == (am.QueuePurgeOK.method_key, 7)
+    key, payload, offset = am.Method.light_from_buffer(raw, offset)
+    assert (key, payload) == (am.TxCommitOK.method_key, None)
+    key, payload, offset = am.Method.light_from_buffer(raw, offset)
+    assert key == am.BasicAck.method_key
+    assert payload == am.BasicAck(delivery_tag=1, multiple=False)
+    assert offset == len(raw)
+
+    with pytest.raises(ae.CommandInvalid):
+        am.Method.light_from_buffer(b'\x00\x0a\x01\x0a')
+
+
+def test_many_methods_can_be_unpacked_from_one_buffer():
+    expected = [
+        am.BasicAck(delivery_tag=1, multiple=False),
+        am.BasicQosOK(),
+        am.BasicAck(delivery_tag=2, multiple=True),
+    ]
+    raw = b''
+    offsets = []
+    for method in expected:
+        offsets.append(len(raw))
+        raw += method.to_bytes()
+
+    assert am.Method.many_from_buffer(raw, offsets) == expected
+
+
+def test_released_methods_are_reused_by_decoders():
+    raw = am.BasicAck(delivery_tag=1, multiple=True).to_bytes()
+    method, _ = am.Method.from_buffer(raw)
+    method.release()
+    assert method.delivery_tag is None
+
+    with pytest.raises(RuntimeError):
+        method.release()
+    assert sum(pooled is method for pooled in am.BasicAck._pool) == 1
+
+    reused = am.Method.from_bytestream(io.BytesIO(raw))
+    assert reused is method
+    assert reused == am.BasicAck(delivery_tag=1, multiple=True)
+
+    qos = am.BasicQos(prefetch_size=0, prefetch_count=10, global_=False)
+    qos.release()
+    assert qos.prefetch_count == 10
+    assert am.BasicQos._pool is None
+
+
+def test_exchange_and_routing_key_values_are_shared():
+    raw = am.BasicDeliver(
+        consumer_tag='ctag', delivery_tag=1, redelivered=False,
+        exchange='exchange', routing_key='key',
+    ).to_bytes()
+
+    first = am.Method.from_bytestream(io.BytesIO(raw))
+    second = am.Method.from_bytestream(io.BytesIO(raw))
+    assert first.exchange == b'exchange'
+    assert first.exchange is second.exchange
+    assert first.routing_key is second.routing_key
+    assert first.consumer_tag is second.consumer_tag
+
+
+def test_exchange_and_routing_key_are_packed_once():
+    am._packed_shortstr.cache_clear()
+    for _ in range(3):
+        method = am.BasicPublish(exchange='exchange', routing_key='key',
+                                 mandatory=False, immediate=False)
+        assert method.to_bytes() == (b'\x00\x3c\x00\x28\x00\x00'
+                                     b'\x08exchange\x03key\x00')
+    assert am._packed_shortstr.cache_info().misses == 2
+
+
+def test_dispatch_tables_match_methods():
+    for (class_id, method_id), method_cls in am.METHODS.items():
+        key = (class_id << 8) | method_id
+        assert method_cls.method_key == key
+        assert am.METHODS_TABLE[key] is method_cls
+        assert am.SYNCHRONOUS_FLAGS[key] == method_cls.synchronous
+        assert (key in am.SYNCHRONOUS_KEYS) == method_cls.synchronous
+
+
+def test_error_codes_are_reply_codes():
+    assert ae.ReplyCode(404) is ae.ReplyCode.NOT_FOUND
+    assert ae.ReplyCode.REPLY_SUCCESS == 200
+    for error_cls in (ae.SoftError.__subclasses__() +
+                      ae.HardError.__subclasses__()):
+        name = ae.ReplyCode(error_cls.code).name
+        assert name.replace('_', '').lower() == error_cls.__name__.lower()
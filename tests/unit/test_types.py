@@ -113,3 +113,127 @@ def test_bools_can_be_compared():
     second = at.Bool(True)
 
     assert first != second
+
+
+def test_tables_can_be_unpacked_from_buffer_at_offset():
+    table = at.Table({'a': 1, 'b': 'value', 'c': {'d': True}, 'e': [2, 'x']})
+    raw = b'prefix' + table.pack()
+
+    value, consumed = at.Table.unpack_from(raw, 6)
+    assert consumed == len(raw) - 6
+    assert at.Table(value) == table
+
+    value, consumed = at.Table.unpack(at.Cursor(raw, 6))
+    assert consumed == len(raw) - 6
+    assert at.Table(value) == table
+
+
+@pytest.mark.parametrize('value,type_cls', [
+    (0, at.SignedByte),
+    (-128, at.SignedByte),
+    (200, at.UnsignedByte),
+    (-129, at.SignedShort),
+    (40000, at.UnsignedShort),
+    (-40000, at.SignedLong),
+    (3000000000, at.UnsignedLong),
+    (-(1 << 63), at.SignedLongLong),
+])
+def test_table_ints_get_the_smallest_type(value, type_cls):
+    table = at.Table({'key': value})
+    assert type(table['key']) is type_cls
+
+    value, _ = at.Table.unpack_from(table.pack())
+    assert at.Table(value) == table
+
+
+def test_table_ints_out_of_range_are_rejected():
+    with pytest.raises(ValueError):
+        at.Table({'key': 1 << 63})
+
+
+def test_tables_can_be_packed_into_buffer():
+    table = at.Table({'a': 1, 'b': 'value', 'c': {'d': [True, 2.5]}})
+    buf = bytearray(b'prefix')
+    table.pack_into(buf)
+
+    assert bytes(buf) == b'prefix' + table.pack()
+    value, _ = at.Table.unpack_from(buf, 6)
+    assert at.Table(value) == table
+
+
+def test_table_keys_are_shared():
+    raw = at.Table({'x-death': 1}).pack()
+    first, _ = at.Table.unpack_from(raw)
+    second, _ = at.Table.unpack_from(raw)
+
+    first_key, = first
+    second_key, = second
+    assert first_key is second_key
+    assert at.Table(first)['x-death'] == 1
+
+
+def test_unknown_table_value_labels_are_rejected():
+    with pytest.raises(ValueError):
+        at.Table.unpack_from(b'\x00\x00\x00\x03\x01kZ')
+
+
+def test_arrays_of_a_single_int_type_can_be_unpacked():
+    array = at.Array([at.SignedLongLong(tag) for tag in range(100)])
+
+    value, consumed = at.Array.unpack_from(array.pack())
+    assert consumed == 4 + 100 * 9
+    assert all(type(item) is at.SignedLongLong for item in value)
+    assert at.Array(value) == array
+
+    mixed = at.Array([at.SignedLongLong(1), 2, at.SignedLongLong(3)])
+    value, _ = at.Array.unpack_from(mixed.pack())
+    assert at.Array(value) == mixed
+
+
+def test_arrays_of_a_single_float_type_can_be_unpacked():
+    array = at.Array([at.Double(tag / 3) for tag in range(10)])
+
+    value, consumed = at.Array.unpack_from(array.pack())
+    assert consumed == 4 + 10 * 9
+    assert all(type(item) is at.Double for item in value)
+    assert at.Array(value) == array
+
+    with pytest.raises(ValueError):
+        at.Array.unpack_from(b'\x00\x00\x00\x05f\x7f\xc0\x00\x00')
+
+
+def test_floats_are_rounded_to_single_precision_once():
+    value = at.Float(0.1)
+    assert float(value) != 0.1
+    assert at.Float(value) is value
+
+    unpacked, consumed = at.Float.unpack_from(value.pack())
+    assert consumed == 4
+    assert type(unpacked) is at.Float
+    assert float(unpacked) == float(value)
+
+    with pytest.raises(ValueError):
+        at.Float.unpack_from(b'\x7f\xc0\x00\x00')
+
+
+@pytest.mark.parametrize('value', [
+    at.Bool(True), at.Void(), at.Table({}), at.Array([]),
+])
+def test_wrapper_types_have_no_instance_dict(value):
+    assert not hasattr(value, '__dict__')
+
+
+def test_tables_and_arrays_support_container_shortcuts():
+    table = at.Table({'a': 1, 'b': 'value'})
+    assert 'a' in table and b'b' in table and 'c' not in table
+    assert table.get('b') == b'value'
+    assert table.get('c', 0) == 0
+    assert table.pop('a') == 1
+    assert list(table.keys()) == [b'b']
+
+    array = at.Array([1, 2])
+    array.extend(array)
+    array.append('x')
+    assert array == [1, 2, 1, 2, b'x']
+    assert isinstance(array[-1], at.LongStr)
+    assert 2 in array and array.index(2) == 1 and array.count(1) == 2